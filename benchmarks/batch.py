@@ -0,0 +1,63 @@
+"""Mesure le mode batch : débit d'essais rejoués depuis un fichier JSONL généré,
+les résultats étant écrits dans /dev/null. Quelques parties de contrôle sont d'abord
+rejouées et leurs résultats vérifiés.
+
+python -m benchmarks.batch [-n 200000] [-g 6] [--seed]
+"""
+import subprocess
+import sys
+from argparse import ArgumentParser
+from json import dumps, loads
+from random import randrange
+from tempfile import NamedTemporaryFile
+
+from mastermind.utils.dir import Dir
+
+BATCH_COMMAND = [sys.executable, '-m', 'mastermind', '-m', 'console', '-l', 'normal', '-t', 'normal', '-b']
+
+
+def random_guess() -> str:
+    return "".join(str(1 + randrange(6)) for _ in range(4))
+
+
+# Parties de contrôle et résultat attendu de chacune : le secret imposé est lu avec
+# les couleurs du niveau de la partie, et un enregistrement invalide n'arrête pas le rejeu
+CHECKS = (
+    ({'level': 'easy', 'secret': '1234', 'guesses': ['1234']}, {'win': True, 'secret': '1234'}),
+    ({'level': 'hard', 'secret': '1278', 'guesses': ['1278']}, {'win': True, 'secret': '1278'}),
+    ({'level': 'hard', 'secret': '1278', 'guesses': 5}, {'error': "invalid guesses"}),
+    ({'level': 'Easy', 'tries': 'Practice', 'secret': '4321', 'guesses': ['1234']}, {'game_over': False}),
+    ({'level': 'normal', 'seed': 1, 'guesses': ['12a4']}, {'error': "invalid guess 1"}),
+)
+
+
+def check() -> None:
+    """Rejoue les parties de contrôle et lève AssertionError si un résultat diffère"""
+    records = "".join(dumps(record) + "\n" for record, _ in CHECKS)
+    result = subprocess.run(BATCH_COMMAND + ['-'], cwd=Dir.ROOT, input=records, capture_output=True,
+                            text=True, check=True)
+    for line, (record, expected) in zip(result.stdout.splitlines(), CHECKS, strict=True):
+        output = loads(line)
+        assert all(output.get(key) == value for key, value in expected.items()), f"{record} gave {output}"
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Mastermind UYS batch", description="Mesure du mode batch")
+    parser.add_argument('-n', '--games', type=int, default=200_000, help="Nombre de parties du fichier")
+    parser.add_argument('-g', '--guesses', type=int, default=6, help="Nombre d'essais par partie")
+    parser.add_argument('--seed', action='store_true', help="Secrets tirés d'une graine plutôt qu'imposés")
+    args = parser.parse_args()
+    check()
+    with NamedTemporaryFile('w', suffix='.jsonl') as corpus:
+        for game in range(args.games):
+            secret = {'seed': game} if args.seed else {'secret': random_guess()}
+            corpus.write(dumps({'id': game, **secret, 'guesses': [random_guess() for _ in range(args.guesses)]}) + "\n")
+        corpus.flush()
+        result = subprocess.run(BATCH_COMMAND + [corpus.name], cwd=Dir.ROOT, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, text=True, check=True)
+    # Bilan écrit par le mode batch sur la sortie d'erreur
+    print(result.stderr.strip())
+
+
+if __name__ == '__main__':
+    main()
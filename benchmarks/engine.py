@@ -0,0 +1,74 @@
+"""Mesure le mode engine : latence d'un essai joué en lockstep (une requête, une réponse)
+puis débit d'essais envoyés en bloc sans attendre les réponses.
+
+python -m benchmarks.engine [-n 20000]
+"""
+import os
+import subprocess
+import sys
+from argparse import ArgumentParser
+from random import randrange
+from threading import Thread
+from time import perf_counter
+
+from mastermind.utils.dir import Dir
+
+ENGINE_COMMAND = [sys.executable, '-m', 'mastermind', '-m', 'engine', '-t', 'practice']
+
+
+def random_guess() -> bytes:
+    return bytes(ord("1") + randrange(6) for _ in range(4)) + b"\n"
+
+
+def read_responses(fd: int, count: int) -> None:
+    """Lit sur fd jusqu'à avoir reçu count lignes"""
+    received = 0
+    while received < count:
+        chunk = os.read(fd, 1 << 16)
+        if not chunk:
+            raise RuntimeError("Engine exited early")
+        received += chunk.count(b"\n")
+
+
+def lockstep(process: subprocess.Popen, moves: int) -> list[float]:
+    """Joue les essais un par un et retourne la durée de chaque aller-retour"""
+    latencies = []
+    for move in range(moves):
+        line = b"new\n" if move % 50 == 0 else random_guess()
+        start = perf_counter()
+        os.write(process.stdin.fileno(), line)
+        read_responses(process.stdout.fileno(), 1)
+        latencies.append(perf_counter() - start)
+    return latencies
+
+
+def pipelined(process: subprocess.Popen, moves: int) -> float:
+    """Envoie tous les essais d'un bloc, les réponses étant lues en parallèle. Retourne la durée"""
+    data = b"".join(b"new\n" if move % 50 == 0 else random_guess() for move in range(moves))
+    reader = Thread(target=read_responses, args=(process.stdout.fileno(), moves))
+    start = perf_counter()
+    reader.start()
+    process.stdin.write(data)
+    process.stdin.flush()
+    reader.join()
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Mastermind UYS engine", description="Mesure du mode engine")
+    parser.add_argument('-n', '--moves', type=int, default=20_000, help="Nombre de requêtes par mesure")
+    args = parser.parse_args()
+    process = subprocess.Popen(ENGINE_COMMAND, cwd=Dir.ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    try:
+        latencies = sorted(lockstep(process, args.moves))
+        elapsed = pipelined(process, args.moves)
+    finally:
+        process.stdin.close()
+        process.wait()
+    for name, rank in (("p50", 0.50), ("p99", 0.99)):
+        print(f"Lockstep {name}: {latencies[int(rank * len(latencies))] * 1e6:.0f} µs")
+    print(f"Pipelined: {args.moves / elapsed:.0f} requests/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Mesure la mémoire occupée par partie, pour l'hébergement de nombreuses parties
+(mode serve) : parties neuves, puis après quelques essais.
+
+python -m benchmarks.memory [-n 100000] [-l hard] [-g 3]
+"""
+import tracemalloc
+from argparse import ArgumentParser
+from random import randrange
+
+from mastermind.model.game import Mastermind
+from mastermind.model.session import SessionStore
+from mastermind.utils.logger import quiet_game_log
+from mastermind.utils.parameters import Level, Try
+
+
+def bytes_per_game(level: Level, games: int, guesses: int) -> tuple[float, float, float]:
+    """Retourne la mémoire moyenne d'une partie neuve, d'une partie après quelques essais
+    et d'une partie neuve hébergée dans un SessionStore (identifiant et date d'utilisation compris)"""
+    Mastermind(level, Try.NORMAL)
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    models = [Mastermind(level, Try.NORMAL) for _ in range(games)]
+    fresh = (tracemalloc.get_traced_memory()[0] - baseline) / games
+    for model in models:
+        for _ in range(guesses):
+            model.evaluate_code(randrange(model.codebook.count))
+    played = (tracemalloc.get_traced_memory()[0] - baseline) / games
+    del models
+    baseline = tracemalloc.get_traced_memory()[0]
+    store = SessionStore(max_sessions=games)
+    for _ in range(games):
+        store.create(level, Try.NORMAL)
+    hosted = (tracemalloc.get_traced_memory()[0] - baseline) / games
+    tracemalloc.stop()
+    return fresh, played, hosted
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Mastermind UYS memory", description="Mesure de la mémoire par partie")
+    parser.add_argument('-n', '--games', type=int, default=100_000, help="Nombre de parties")
+    parser.add_argument('-l', '--level', choices=Level.to_list(), default=str(Level.HARD), help="Niveau")
+    parser.add_argument('-g', '--guesses', type=int, default=3, help="Nombre d'essais joués par partie")
+    args = parser.parse_args()
+    quiet_game_log()
+    fresh, played, hosted = bytes_per_game(Level.from_string(args.level), args.games, args.guesses)
+    print(f"Fresh game: {fresh:.0f} bytes, after {args.guesses} guesses: {played:.0f} bytes, "
+          f"hosted in a session store: {hosted:.0f} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Lance les mesures de performance et les compare à une référence.
+
+python -m benchmarks.run [-k filtre] [--baseline fichier] [--threshold 0.1] [--update-baseline]
+"""
+import json
+import platform
+from argparse import ArgumentParser
+from pathlib import Path
+from sys import exit
+from timeit import Timer
+
+from benchmarks.suite import BENCHMARKS
+
+BENCHMARKS_DIR = Path(__file__).parent
+
+
+def init_cli_parser() -> ArgumentParser:
+    """Initialisation du parser des options du lanceur"""
+    parser = ArgumentParser(prog="Mastermind UYS benchmarks",
+                            description="Mesure les chemins critiques et détecte les régressions")
+    parser.add_argument('-k', '--filter', default="",
+                        help="Ne lance que les mesures dont le nom contient ce texte")
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help="Nombre de répétitions, la meilleure est retenue")
+    parser.add_argument('-o', '--output', type=Path, default=BENCHMARKS_DIR / "results.json",
+                        help="Fichier JSON des résultats")
+    parser.add_argument('-b', '--baseline', type=Path, default=BENCHMARKS_DIR / "baseline.json",
+                        help="Fichier JSON de référence")
+    parser.add_argument('-t', '--threshold', type=float, default=0.10,
+                        help="Ralentissement relatif toléré avant de signaler une régression")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="Enregistre les résultats comme nouvelle référence")
+    return parser
+
+
+def measure(name: str, repeat: int) -> dict:
+    """Chronomètre une mesure et retourne le temps par opération unitaire"""
+    operation, operations = BENCHMARKS[name]()
+    timer = Timer(operation)
+    # Le calibrage sert aussi d'échauffement pour les initialisations paresseuses (tables, imports)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return {'seconds_per_op': best / operations, 'ops_per_second': operations / best}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Retourne les noms des mesures plus lentes que la référence au-delà du seuil"""
+    return [name for name, result in results.items()
+            if name in baseline
+            and result['seconds_per_op'] > baseline[name]['seconds_per_op'] * (1 + threshold)]
+
+
+def to_json(results: dict) -> str:
+    """Sérialise les résultats avec la version de Python utilisée"""
+    return json.dumps({'python': platform.python_version(), 'results': results}, indent=4)
+
+
+def main() -> None:
+    args = init_cli_parser().parse_args()
+    baseline = (json.loads(args.baseline.read_text(encoding='utf-8'))['results']
+                if args.baseline.exists() else {})
+    results = {}
+    for name in BENCHMARKS:
+        if args.filter not in name:
+            continue
+        results[name] = measure(name, args.repeat)
+        reference = baseline.get(name)
+        ratio = f"{results[name]['seconds_per_op'] / reference['seconds_per_op']:6.2f}x" if reference else "      -"
+        print(f"{name:<45} {results[name]['seconds_per_op'] * 1e6:>14.3f} µs/op {ratio}", flush=True)
+
+    args.output.write_text(to_json(results), encoding='utf-8')
+    if args.update_baseline:
+        args.baseline.write_text(to_json({**baseline, **results}), encoding='utf-8')
+        print(f"Baseline updated: {args.baseline}")
+        return
+    regressions = compare(results, baseline, args.threshold)
+    for name in regressions:
+        print(f"REGRESSION {name}: more than {args.threshold:.0%} slower than baseline")
+    exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
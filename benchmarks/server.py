@@ -0,0 +1,74 @@
+"""Charge le serveur de parties : ouvre de nombreuses sessions puis mesure
+la latence des essais (aller-retour complet sur localhost).
+
+python -m benchmarks.server [-s 20000] [-c 1] [-g 5]
+"""
+import asyncio
+import subprocess
+import sys
+from argparse import ArgumentParser
+from json import dumps, loads
+from random import choice
+from time import perf_counter
+
+from mastermind.utils.dir import Dir
+
+SERVER_COMMAND = [sys.executable, '-m', 'mastermind', '-m', 'serve', '--port', '0']
+
+
+async def request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, message: dict) -> dict:
+    writer.write(dumps(message).encode() + b"\n")
+    return loads(await reader.readline())
+
+
+async def run_client(port: int, sessions: int, guesses: int, latencies: list[float]) -> None:
+    """Ouvre une connexion, y démarre des parties puis joue des essais à tour de rôle,
+    une requête à la fois pour mesurer la latence de chacune"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    games = []
+    for _ in range(sessions):
+        response = await request(reader, writer, {'command': 'start', 'level': 'hard'})
+        games.append((response['session'], response['colors'], response['size']))
+    for _ in range(guesses):
+        for session, colors, size in games:
+            message = {'command': 'guess', 'session': session, 'combination': [choice(colors) for _ in range(size)]}
+            start = perf_counter()
+            await request(reader, writer, message)
+            latencies.append(perf_counter() - start)
+    writer.close()
+    await writer.wait_closed()
+
+
+async def load(port: int, sessions: int, clients: int, guesses: int) -> list[float]:
+    latencies: list[float] = []
+    await asyncio.gather(*(run_client(port, sessions // clients, guesses, latencies) for _ in range(clients)))
+    return latencies
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Mastermind UYS server load", description="Mesure de la latence du serveur")
+    parser.add_argument('-s', '--sessions', type=int, default=20_000, help="Nombre de parties simultanées")
+    parser.add_argument('-c', '--clients', type=int, default=1,
+                        help="Nombre de connexions, chacune avec une seule requête en cours")
+    parser.add_argument('-g', '--guesses', type=int, default=5, help="Nombre d'essais par partie")
+    args = parser.parse_args()
+
+    server = subprocess.Popen(SERVER_COMMAND + ['--max-sessions', str(args.sessions)], cwd=Dir.ROOT,
+                              stdout=subprocess.PIPE, text=True)
+    try:
+        # Première ligne : "Serving on hôte:port ..."
+        port = int(server.stdout.readline().split()[2].rsplit(":", 1)[1])
+        start = perf_counter()
+        latencies = sorted(asyncio.run(load(port, args.sessions, args.clients, args.guesses)))
+        elapsed = perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait()
+    print(f"{args.sessions} sessions, {args.clients} clients, {len(latencies)} guesses "
+          f"in {elapsed:.1f}s ({len(latencies) / elapsed:.0f} guesses/s including game starts)")
+    for name, rank in (("p50", 0.50), ("p99", 0.99), ("max", 1.0)):
+        print(f"{name}: {latencies[min(len(latencies) - 1, int(rank * len(latencies)))] * 1000:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
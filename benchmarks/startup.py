@@ -0,0 +1,65 @@
+"""Mesure le démarrage à froid du mode console : temps jusqu'à la première
+invite de saisie et répartition du temps d'import par module.
+
+python -m benchmarks.startup [-n 10] [--top 15]
+"""
+import subprocess
+import sys
+from argparse import ArgumentParser
+from time import perf_counter
+
+from mastermind.utils.dir import Dir
+
+CONSOLE_COMMAND = [sys.executable, '-m', 'mastermind', '-m', 'console']
+
+
+def time_to_prompt() -> float:
+    """Lance le mode console et retourne le temps écoulé jusqu'à l'affichage de l'invite de saisie"""
+    start = perf_counter()
+    process = subprocess.Popen(CONSOLE_COMMAND, cwd=Dir.ROOT, stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        # L'invite de saisie, contrairement aux règles, se termine par ": " sans retour à la ligne
+        output = b""
+        while not output.endswith(b": "):
+            chunk = process.stdout.read1(4096)
+            if not chunk:
+                raise RuntimeError("Console mode exited before prompting")
+            output += chunk
+        return perf_counter() - start
+    finally:
+        process.kill()
+        process.wait()
+
+
+def import_breakdown() -> list[tuple[str, int, int]]:
+    """Retourne, pour chaque module importé au démarrage du mode console,
+    (nom, temps propre, temps cumulé) en microsecondes, du plus coûteux au moins coûteux"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import mastermind.__main__'],
+                            cwd=Dir.ROOT, capture_output=True, text=True, check=True)
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line.removeprefix("import time:").split("|")
+        modules.append((name.strip(), int(self_time), int(cumulative)))
+    return sorted(modules, key=lambda module: module[1], reverse=True)
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Mastermind UYS startup", description="Mesure du démarrage du mode console")
+    parser.add_argument('-n', '--runs', type=int, default=10, help="Nombre de lancements, le meilleur est retenu")
+    parser.add_argument('--top', type=int, default=15, help="Nombre de modules affichés")
+    args = parser.parse_args()
+
+    modules = import_breakdown()
+    print(f"{'module':<50} {'self [ms]':>10} {'cumul. [ms]':>12}")
+    for name, self_time, cumulative in modules[:args.top]:
+        print(f"{name:<50} {self_time / 1000:>10.2f} {cumulative / 1000:>12.2f}")
+    print(f"Total import time: {sum(module[1] for module in modules) / 1000:.1f} ms "
+          f"({len(modules)} modules, Qt loaded: {any(name.startswith('PySide6') for name, *_ in modules)})")
+    print(f"Time to first console prompt: {min(time_to_prompt() for _ in range(args.runs)) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+import os
+from random import randrange
+from typing import Callable
+
+from mastermind.model.game import Mastermind
+from mastermind.model.language import get_help, get_translation
+from mastermind.model.settings import Config
+from mastermind.utils.parameters import Language, Level, Try, View
+
+# Une mesure : préparée une fois, elle retourne l'opération à chronométrer
+# et le nombre d'opérations unitaires réalisées par appel
+Benchmark = Callable[[], tuple[Callable[[], object], int]]
+BENCHMARKS: dict[str, Benchmark] = {}
+
+OPERATIONS = 1000
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """Enregistre une mesure sous le nom donné"""
+    def register(function: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+def _random_combinations(model: Mastermind, number: int) -> list[tuple]:
+    return [model.codebook.decode(randrange(model.codebook.count)) for _ in range(number)]
+
+
+for _level in Level:
+    @benchmark(f"model.evaluate_combinaison.{_level}")
+    def _evaluate_combinaison(level: Level = _level):
+        model = Mastermind(level, Try.NORMAL)
+        combinations = _random_combinations(model, OPERATIONS)
+
+        def run() -> None:
+            model.init_new_game(level, Try.NORMAL)
+            for combination in combinations:
+                model.evaluate_combinaison(combination)
+        return run, OPERATIONS
+
+    @benchmark(f"model.generate_secret.{_level}")
+    def _generate_secret(level: Level = _level):
+        model = Mastermind(level, Try.NORMAL)
+
+        def run() -> None:
+            for _ in range(OPERATIONS):
+                model._generate_combinaison()
+        return run, OPERATIONS
+
+    @benchmark(f"model.random_codes.{_level}")
+    def _random_codes(level: Level = _level):
+        import numpy as np
+        from mastermind.model.scoring import random_codes
+        generator = np.random.default_rng(0)
+        return lambda: random_codes(1 << 20, level.value, rng=generator), 1 << 20
+
+    @benchmark(f"model.evaluate_batch.{_level}")
+    def _evaluate_batch(level: Level = _level):
+        from mastermind.model.scoring import all_combinations, evaluate_batch
+        combinations = all_combinations(level.value)
+        return lambda: evaluate_batch(combinations, combinations, level.value), len(combinations) ** 2
+
+    @benchmark(f"solver.knuth.second_move.{_level}")
+    def _knuth_second_move(level: Level = _level):
+        from mastermind.solver.knuth import KnuthSolver
+        solver = KnuthSolver(level.value)
+        opening = solver.opening()
+
+        def run() -> None:
+            solver.reset()
+            solver.observe(opening, int(solver.table[opening, randrange(solver.codebook.count)]))
+            solver._choose_code()
+        return run, 1
+
+
+@benchmark("model.stream_count.10x8")
+def _stream_count():
+    from mastermind.model.code import get_codebook, pack_feedback
+    from mastermind.model.scoring import get_stream
+    codebook, stream = get_codebook(10, 8), get_stream(10, 8)
+    guess, secret = 1234567, 87654321
+    history = [(codebook.digits_of(guess), pack_feedback(*codebook.score(guess, secret)))]
+    return lambda: stream.count_consistent(history), codebook.count
+
+
+@benchmark("config.load")
+def _config_load():
+    return Config, 1
+
+
+@benchmark("language.get_translation")
+def _get_translation():
+    def run() -> None:
+        for _ in range(OPERATIONS):
+            get_translation(Language.EN, 'input_user')
+    return run, OPERATIONS
+
+
+for _view in (View.CONSOLE, View.WINDOW):
+    @benchmark(f"language.get_help.{_view}")
+    def _get_help(view: View = _view):
+        return lambda: get_help(view, Language.FR), 1
+
+
+for _tries in Try:
+    @benchmark(f"ui.setup_ui.{_tries}")
+    def _setup_ui(tries: Try = _tries):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PySide6.QtCore import QEvent
+        from PySide6.QtWidgets import QApplication
+        from mastermind.views.main_window import MainWindow
+        app = QApplication.instance() or QApplication()
+        model = Mastermind(Level.NORMAL, tries)
+        translation = {key: key for key in (
+            'main_title', 'select_color', 'submit_button', 'hint_button', 'help_button', 'new_game', 'quit_button'
+        )}
+
+        def run() -> None:
+            window = MainWindow()
+            window.setup_ui(tries.value, model.level.value, model.secret_combination, Language.FR, translation)
+            window.deleteLater()
+            app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        return run, 1
@@ -1,15 +1,16 @@
-from argparse import ArgumentParser
+import os
+from argparse import ArgumentParser, Namespace
+from random import Random
 from sys import exit
 
-from PySide6.QtWidgets import QApplication
-
-from mastermind.controllers.console_controller import ConsoleController
-from mastermind.controllers.window_controller import WindowController
 from mastermind.model.game import Mastermind
-from mastermind.model.settings import Config
-from mastermind.utils.parameters import Level, Try, View
-from mastermind.views.console import Console
-from mastermind.views.main_window import MainWindow
+from mastermind.model.settings import (COLORS_NUMBERS, Config, IDLE_TIMEOUT, MAX_SESSIONS, SIZE_COMBINATION,
+                                       SIZES_COMBINATION)
+from mastermind.utils.logger import quiet_game_log
+from mastermind.utils.parameters import Level, Solver, Try, View
+
+# Les contrôleurs et vues ne sont importés que par le mode qui les utilise :
+# les modes console et sans interface ne chargent ni Qt ni NumPy au démarrage
 
 
 def init_cli_parser(config: Config):
@@ -31,18 +32,103 @@ def init_cli_parser(config: Config):
                         choices=Try.to_list(),
                         default=config.tries.name.lower(),
                         help="Nombre d'essais maximum")
+    parser.add_argument('-p', '--pegs',
+                        type=int,
+                        choices=SIZES_COMBINATION,
+                        default=SIZE_COMBINATION,
+                        help="Nombre de pions d'une combinaison (modes console et engine)")
+    parser.add_argument('-c', '--colors',
+                        type=int,
+                        choices=COLORS_NUMBERS,
+                        help="Nombre de couleurs disponible, remplace celui du niveau (modes console et engine)")
+    parser.add_argument('-e', '--evil',
+                        action='store_true',
+                        help="Mode adversaire : le secret est choisi au fil des essais (modes console, engine et window)")
+    parser.add_argument('--seed',
+                        type=int,
+                        help="Graine du générateur aléatoire, pour rejouer à l'identique secrets et simulations")
+    parser.add_argument('-b', '--batch',
+                        metavar='FILE',
+                        help="Rejoue les parties d'un fichier JSONL, '-' pour l'entrée standard (mode console)")
+    parser.add_argument('-g', '--games',
+                        type=int,
+                        default=100_000,
+                        help="Nombre de parties à jouer (mode simulate)")
+    parser.add_argument('-s', '--strategy',
+                        choices=Solver.to_list(),
+                        default=Solver.KNUTH.value,
+                        help="Stratégie de résolution (mode simulate)")
+    parser.add_argument('-w', '--workers',
+                        type=int,
+                        default=os.cpu_count(),
+                        help="Nombre de processus (mode simulate)")
+    parser.add_argument('--host',
+                        default="127.0.0.1",
+                        help="Adresse d'écoute (mode serve)")
+    parser.add_argument('--port',
+                        type=int,
+                        default=4242,
+                        help="Port d'écoute, 0 pour un port libre (mode serve)")
+    parser.add_argument('--max-sessions',
+                        type=int,
+                        default=MAX_SESSIONS,
+                        help="Nombre maximal de parties en mémoire (mode serve)")
+    parser.add_argument('--idle-timeout',
+                        type=float,
+                        default=IDLE_TIMEOUT,
+                        help="Délai en secondes avant le retrait d'une partie inactive (mode serve)")
     return parser
 
 
 def run_console(model: Mastermind, config: Config) -> None:
     """Lancement d'une partie en mode console"""
+    from mastermind.controllers.console_controller import ConsoleController
+    from mastermind.views.console import Console
     view = Console()
     controller = ConsoleController(model, config, view)
     controller.run()
 
 
+def run_batch(model: Mastermind, source: str) -> None:
+    """Rejeu en flux de parties lues depuis un fichier ou l'entrée standard"""
+    from mastermind.controllers.batch_controller import BatchController
+    from mastermind.views.batch import Batch
+    controller = BatchController(model, Batch(source))
+    controller.run()
+
+
+def run_engine(model: Mastermind) -> None:
+    """Lancement du protocole texte pour les programmes externes"""
+    from mastermind.controllers.engine_controller import EngineController
+    from mastermind.views.engine import Engine
+    controller = EngineController(model, Engine())
+    controller.run()
+
+
+def run_simulation(model: Mastermind, args: Namespace) -> None:
+    """Lancement d'une simulation de parties sans interface"""
+    from mastermind.controllers.simulation_controller import SimulationController
+    from mastermind.views.simulation import Simulation
+    controller = SimulationController(model.level, model.max_tries, Solver.from_string(args.strategy),
+                                      args.games, args.workers, Simulation(), args.seed)
+    controller.run()
+
+
+def run_server(config: Config, args: Namespace) -> None:
+    """Lancement du serveur de parties"""
+    from mastermind.controllers.server_controller import ServerController
+    from mastermind.model.session import SessionStore
+    from mastermind.views.server import Server
+    controller = ServerController(config, SessionStore(args.max_sessions, args.idle_timeout, Random(args.seed)),
+                                  args.host, args.port, Server())
+    controller.run()
+
+
 def run_window(model: Mastermind, config: Config) -> None:
     """Lancement d'une partie en mode fenêtré"""
+    from PySide6.QtWidgets import QApplication
+    from mastermind.controllers.window_controller import WindowController
+    from mastermind.views.main_window import MainWindow
     app = QApplication()
     view = MainWindow()
     controller = WindowController(model, config, view)
@@ -57,8 +143,28 @@ def main() -> None:
     args = parser.parse_args()
     config.level = Level.from_string(args.level)
     config.tries = Try.from_string(args.tries)
-    model = Mastermind(config.level, config.tries)
-    run_window(model, config) if View.from_string(args.mode) == View.WINDOW else run_console(model, config)
+    mode = View.from_string(args.mode)
+    if mode not in (View.CONSOLE, View.ENGINE) and (args.pegs != SIZE_COMBINATION or args.colors is not None):
+        parser.error("--pegs and --colors are only available in console and engine modes")
+    if args.batch is not None and mode != View.CONSOLE:
+        parser.error("--batch is only available in console mode")
+    if mode in (View.ENGINE, View.SIMULATE, View.SERVE) or args.batch is not None:
+        # Modes sans interface, avant la première partie
+        quiet_game_log()
+    model = Mastermind(config.level, config.tries, args.evil, args.colors, args.pegs, Random(args.seed))
+    match mode:
+        case View.WINDOW:
+            run_window(model, config)
+        case View.CONSOLE if args.batch is not None:
+            run_batch(model, args.batch)
+        case View.CONSOLE:
+            run_console(model, config)
+        case View.ENGINE:
+            run_engine(model)
+        case View.SIMULATE:
+            run_simulation(model, args)
+        case View.SERVE:
+            run_server(config, args)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,108 @@
+from json import dumps, loads
+from time import perf_counter
+from typing import Iterable, Iterator
+
+from mastermind.model.code import Code, get_codebook, unpack_feedback
+from mastermind.model.game import Mastermind
+from mastermind.utils.parameters import Level, Try
+from mastermind.views.batch import Batch
+
+# Les lignes de résultat sont écrites directement plutôt qu'avec json.dumps, qui coûte à lui seul
+# autant que l'évaluation de tous les essais d'une partie.
+# Écriture JSON de chaque octet d'indices (voir pack_feedback) et des booléens
+FEEDBACK_JSON = tuple("[{}, {}]".format(*unpack_feedback(value)) for value in range(256))
+BOOLEAN_JSON = ("false", "true")
+
+
+class BatchController:
+    """Rejoue des parties lues en JSONL, une partie par ligne :
+    {"id": ..., "level": "hard", "tries": "normal", "secret": "1234" ou "seed": 42, "guesses": ["1122", ...]}
+    Seul "guesses" est requis, les essais étant saisis en chiffres comme en mode console.
+    Lecture, évaluation et écriture forment une chaîne de générateurs : une seule partie
+    est en mémoire à la fois, quelle que soit la taille de la source"""
+    def __init__(self, model: Mastermind, view: Batch) -> None:
+        self.model = model
+        self.view = view
+        self.games = self.guesses = self.errors = 0
+
+    @staticmethod
+    def _records(lines: Iterable[bytes]) -> Iterator[tuple[int, dict | str]]:
+        """Retourne chaque ligne non vide décodée, avec son numéro, ou la raison de son rejet"""
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = loads(line)
+            except ValueError:
+                yield number, "invalid JSON"
+                continue
+            yield number, record if isinstance(record, dict) else "invalid record"
+
+    def _secret(self, record: dict, level: Level) -> Code | None:
+        """Retourne le secret imposé par l'enregistrement, lu avec les couleurs du niveau de la partie,
+        None pour un secret tiré par le générateur de la partie.
+        Une graine réinitialise ce générateur : la partie est alors reproductible"""
+        if 'secret' in record:
+            codebook = get_codebook(self.model.colors or level.value, self.model.size)
+            if (secret := codebook.parse(str(record['secret']))) is None:
+                raise ValueError("invalid secret")
+            return secret
+        if 'seed' in record:
+            try:
+                self.model.rng.seed(record['seed'])
+            except TypeError:
+                raise ValueError("invalid seed") from None
+        return None
+
+    def _play_game(self, number: int, record: dict) -> str:
+        """Joue les essais d'une partie jusqu'au premier essai invalide ou à la fin de la partie
+        et retourne la ligne de résultat"""
+        try:
+            level = Level.from_string(record['level']) if 'level' in record else self.model.level
+            tries = Try.from_string(record['tries']) if 'tries' in record else self.model.max_tries
+        except (StopIteration, AttributeError, TypeError):
+            raise ValueError("unknown level or tries") from None
+        if not isinstance(guesses := record.get('guesses', []), list):
+            raise ValueError("invalid guesses")
+        model = self.model
+        model.init_new_game(level, tries, secret=self._secret(record, level))
+        codebook = model.codebook
+        # Essais lus dans la table des saisies quand l'espace est précalculé
+        parse = codebook.typed_codes.get if codebook.precomputed else codebook.parse
+        evaluate = model.evaluate_code
+        fields = ""
+        if 'id' in record:
+            # Identifiant renvoyé tel quel, le plus souvent un entier dont l'écriture JSON est immédiate
+            identifier = record['id']
+            fields = f'"id": {identifier if type(identifier) is int else dumps(identifier)}, '
+        feedback = []
+        for typed in guesses:
+            if model.game_over:
+                break
+            if not isinstance(typed, str) or (code := parse(typed)) is None:
+                fields += f'"error": "invalid guess {len(feedback) + 1}", '
+                self.errors += 1
+                break
+            feedback.append(FEEDBACK_JSON[evaluate(code)])
+        self.guesses += len(feedback)
+        return (f'{{"line": {number}, {fields}"feedback": [{", ".join(feedback)}], '
+                f'"win": {BOOLEAN_JSON[model.win]}, "game_over": {BOOLEAN_JSON[model.game_over]}, '
+                f'"secret": "{model.codebook.format(model.secret_code)}"}}')
+
+    def _play(self, records: Iterable[tuple[int, dict | str]]) -> Iterator[str]:
+        """Retourne la ligne de résultat de chaque partie, ou de l'erreur qui l'a empêchée"""
+        for number, record in records:
+            self.games += 1
+            try:
+                if isinstance(record, str):
+                    raise ValueError(record)
+                yield self._play_game(number, record)
+            except ValueError as e:
+                self.errors += 1
+                yield dumps({'line': number, 'error': str(e)})
+
+    def run(self) -> None:
+        """Traite toute la source"""
+        start = perf_counter()
+        self.view.write_lines(self._play(self._records(self.view.read_lines())))
+        self.view.show_summary(self.games, self.guesses, self.errors, perf_counter() - start)
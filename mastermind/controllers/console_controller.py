@@ -1,6 +1,6 @@
 from mastermind.model.game import Mastermind
 from mastermind.model.language import get_translation, get_help
-from mastermind.model.settings import Config, DOT, SIZE_COMBINATION, SQUARE
+from mastermind.model.settings import Config, DOT, SQUARE
 from mastermind.utils.parameters import Color, View
 from mastermind.views.console import Console
 
@@ -10,7 +10,8 @@ class ConsoleController:
         self.model = model
         self.config = config
         self.view = view
-        self.colors = {str(i): color for i, color in enumerate(self.model.available_colors, 1)}
+        # Chaque couleur est saisie avec un chiffre, 0 désignant la dixième
+        self.colors = {str(i % 10): color for i, color in enumerate(self.model.available_colors, 1)}
 
     def _convertion_color(self, colors: tuple[Color, ...], symbol: str = None) -> tuple[str, ...]:
         """Construit une liste de chaînes de caractères colorées (ANSI)"""
@@ -18,7 +19,7 @@ class ConsoleController:
         for i, color in enumerate(colors, 1):
             red, green, blue = color.to_rgb()
             if not symbol:
-                number = f"[{i}]"
+                number = f"[{i % 10}]"
                 text = get_translation(self.config.language, color.name).capitalize()
             str_color.append(f"{number} \033[38;2;{red};{green};{blue}m{text}")
         return tuple(str_color)
@@ -41,14 +42,21 @@ class ConsoleController:
         sentence = get_translation(self.config.language, "input_user").format(
             try_number=try_number,
             max_tries=self.model.max_tries.value,
-            size_combination=SIZE_COMBINATION
+            size_combination=self.model.codebook.size
         )
         user_combination = self.view.get_user_combination(sentence)
-        return tuple(self.colors.get(char, Color.GRAY) for char in user_combination)
+        # Un caractère inconnu donne None, la combinaison est alors refusée par le modèle
+        return tuple(self.colors.get(char) for char in user_combination)
+
+    def _show_remaining(self) -> None:
+        """Fait afficher à l'UI le nombre de combinaisons encore possibles"""
+        self.view.show_remaining(get_translation(self.config.language, "remaining_combinations").format(
+            count=self.model.remaining_count
+        ))
 
     def run(self) -> None:
         """Boucle du jeu"""
-        self.view.show_rules(get_help(View.CONSOLE, self.config.language),
+        self.view.show_rules(get_help(View.CONSOLE, self.config.language, self.model.codebook.size),
                              self._convertion_color(self.model.available_colors))
         while True:
             colored_combination = self._get_user_combination()
@@ -63,3 +71,4 @@ class ConsoleController:
 
             if self._endgame():
                 break
+            self._show_remaining()
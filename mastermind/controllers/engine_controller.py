@@ -0,0 +1,68 @@
+from mastermind.model.code import unpack_feedback
+from mastermind.model.game import Mastermind
+from mastermind.utils.parameters import Level, Try
+from mastermind.views.engine import Engine
+
+
+class EngineController:
+    """Protocole texte pour les programmes externes, une réponse d'une ligne par requête :
+    - 'new [niveau] [essais]' démarre une partie et répond 'ready <couleurs> <pions> <essais>'
+    - une combinaison de chiffres (1 à 9 puis 0 pour la dixième couleur) répond 'R W',
+      suivi de 'win <secret>' ou 'lose <secret>' si la partie se termine
+    - 'quit' arrête le programme
+    Les erreurs répondent 'error <raison>'"""
+    def __init__(self, model: Mastermind, view: Engine) -> None:
+        self.model = model
+        self.view = view
+        self.running = True
+
+    def _new_game(self, words: list[bytes]) -> str:
+        try:
+            level = Level.from_string(words[1].decode()) if len(words) > 1 else self.model.level
+            tries = Try.from_string(words[2].decode().lower()) if len(words) > 2 else self.model.max_tries
+        except (StopIteration, UnicodeDecodeError):
+            return "error parameters"
+        self.model.init_new_game(level, tries)
+        return f"ready {self.model.codebook.colors} {self.model.codebook.size} {tries.value}"
+
+    def _guess(self, line: bytes) -> str:
+        """Évalue un essai saisi en chiffres, sans passer par les Color"""
+        if self.model.game_over:
+            return "error over"
+        if (code := self.model.codebook.parse(line.decode('ascii', 'replace'))) is None:
+            return "error invalid"
+        red, white = unpack_feedback(self.model.evaluate_code(code))
+        if not self.model.game_over:
+            return f"{red} {white}"
+        outcome = 'win' if self.model.win else 'lose'
+        return f"{red} {white} {outcome} {self.model.codebook.format(self.model.secret_code)}"
+
+    def handle(self, line: bytes) -> str | None:
+        """Retourne la réponse à une ligne de requête, None pour une ligne vide"""
+        line = line.strip()
+        if not line:
+            return None
+        if line[:1].isdigit():
+            return self._guess(line)
+        words = line.split()
+        match words[0]:
+            case b"new":
+                return self._new_game(words)
+            case b"quit":
+                self.running = False
+                return None
+        return "error unknown"
+
+    def run(self) -> None:
+        """Répond aux requêtes jusqu'à 'quit' ou la fin de l'entrée standard"""
+        for lines in self.view.read_batches():
+            responses = []
+            for line in lines:
+                if (response := self.handle(line)) is not None:
+                    responses.append(response)
+                if not self.running:
+                    break
+            if responses:
+                self.view.write(responses)
+            if not self.running:
+                break
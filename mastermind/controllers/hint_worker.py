@@ -0,0 +1,47 @@
+from threading import Event
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from mastermind.model.code import Code
+from mastermind.solver.knuth import KnuthSolver
+from mastermind.solver.strategy import SearchCancelled
+
+# Taille des blocs de la recherche : un bloc prend quelques millisecondes au plus,
+# le thread graphique récupère donc la main bien avant la fin d'une image (16 ms)
+HINT_BLOCK_CELLS = 1 << 18
+
+
+class HintSignals(QObject):
+    """Signaux du calcul d'un indice. Créé dans le thread graphique,
+    les résultats émis depuis le thread de calcul y sont remis par la boucle d'événements"""
+    found = Signal(int, int)
+
+
+class HintWorker(QRunnable):
+    """Calcule, dans un thread du QThreadPool, le prochain essai conseillé
+    d'après l'historique de la partie. Le calcul peut être annulé à tout moment"""
+    def __init__(self, request: int, colors: int, size: int, history: list[tuple[Code, int]]) -> None:
+        super().__init__()
+        self.request = request
+        self.colors = colors
+        self.size = size
+        self.history = list(history)
+        self.cancel_event = Event()
+        self.signals = HintSignals()
+
+    def cancel(self) -> None:
+        """Demande l'arrêt du calcul, aucun résultat ne sera émis"""
+        self.cancel_event.set()
+
+    def run(self) -> None:
+        strategy = KnuthSolver(self.colors, self.size)
+        strategy.block_cells = HINT_BLOCK_CELLS
+        strategy.cancel_event = self.cancel_event
+        for guess, feedback in self.history:
+            strategy.observe(guess, feedback)
+        try:
+            code = strategy.next_code()
+        except SearchCancelled:
+            return
+        if not self.cancel_event.is_set():
+            self.signals.found.emit(self.request, code)
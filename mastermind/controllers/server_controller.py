@@ -0,0 +1,154 @@
+import asyncio
+from json import dumps, loads
+
+from mastermind.model.game import Mastermind
+from mastermind.model.session import SessionStore
+from mastermind.model.settings import Config
+from mastermind.utils.logger import setup_logger
+from mastermind.utils.parameters import Color, Level, Try
+from mastermind.views.server import Server
+
+# Intervalle maximal, en secondes, entre deux recherches de parties inactives
+EXPIRY_INTERVAL = 5.0
+# Nombre de connexions en attente d'acceptation
+BACKLOG = 1024
+# Taille maximale, en octets, d'une ligne de requête
+MAX_LINE = 1 << 16
+
+
+class ProtocolError(Exception):
+    """Requête invalide, son message est renvoyé au client"""
+
+
+class ClientProtocol(asyncio.Protocol):
+    """Connexion d'un client. Les requêtes arrivées dans un même paquet sont traitées
+    à la suite et leurs réponses envoyées en une seule écriture, sans coroutine par requête"""
+    def __init__(self, controller: 'ServerController') -> None:
+        self.controller = controller
+        self.transport: asyncio.Transport | None = None
+        self._buffer = b""
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        *lines, self._buffer = (self._buffer + data).split(b"\n")
+        if len(self._buffer) > MAX_LINE:
+            ServerController.log.warning("Client dropped: request line too long")
+            self.transport.close()
+            return
+        responses = [dumps(self.controller.handle_request(line)) for line in lines if line.strip()]
+        if responses:
+            self.transport.write(("\n".join(responses) + "\n").encode())
+
+    def pause_writing(self) -> None:
+        """Le client ne lit plus ses réponses : ses requêtes ne sont plus lues non plus"""
+        self.transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        self.transport.resume_reading()
+
+
+class ServerController:
+    """Serveur de parties : une requête JSON par ligne sur TCP, une réponse JSON par ligne.
+    Commandes : start (level, tries, evil facultatifs), guess (session, combination), status (session).
+    Un champ id dans la requête est renvoyé tel quel, pour les clients qui enchaînent les requêtes"""
+    log = setup_logger("server")
+
+    def __init__(self, config: Config, store: SessionStore, host: str, port: int, view: Server) -> None:
+        self.config = config
+        self.store = store
+        self.host = host
+        self.port = port
+        self.view = view
+        self._commands = {'start': self._start, 'guess': self._guess, 'status': self._status}
+
+    @staticmethod
+    def _game_status(game: Mastermind) -> dict:
+        """Retourne l'état de la partie, avec la combinaison secrète une fois la partie terminée"""
+        status = {'remaining_tries': game.remaining_tries, 'game_over': game.game_over, 'win': game.win}
+        if game.game_over:
+            status['secret'] = [color.name for color in game.secret_combination]
+        return status
+
+    def _get_game(self, request: dict) -> Mastermind:
+        if (game := self.store.get(request.get('session'))) is None:
+            raise ProtocolError("Unknown or expired session")
+        return game
+
+    def _start(self, request: dict) -> dict:
+        """Démarre une partie, le niveau et le nombre d'essais du paramétrage servant de valeurs par défaut"""
+        try:
+            level = Level.from_string(request.get('level', str(self.config.level)))
+            tries = Try.from_string(request.get('tries', str(self.config.tries)))
+        except (StopIteration, AttributeError):
+            raise ProtocolError("Unknown level or tries") from None
+        if not isinstance(evil := request.get('evil', False), bool):
+            raise ProtocolError("Invalid evil")
+        session_id, game = self.store.create(level, tries, evil)
+        return {'session': session_id, 'colors': [color.name for color in game.available_colors],
+                'size': game.codebook.size, **self._game_status(game)}
+
+    def _guess(self, request: dict) -> dict:
+        """Évalue une combinaison, liste de noms de couleurs sans distinction de casse,
+        et retourne le nombre d'indices rouges et blancs"""
+        game = self._get_game(request)
+        if game.game_over:
+            raise ProtocolError("Game is over")
+        names = request.get('combination')
+        if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+            raise ProtocolError("Invalid combination")
+        try:
+            combination = tuple(Color[name.upper()] for name in names)
+        except KeyError:
+            raise ProtocolError("Invalid combination") from None
+        if (clues := game.evaluate_combinaison(combination)) is None:
+            raise ProtocolError("Invalid combination")
+        return {'red': clues.count(Color.RED), 'white': clues.count(Color.WHITE), **self._game_status(game)}
+
+    def _status(self, request: dict) -> dict:
+        return self._game_status(self._get_game(request))
+
+    def handle_request(self, line: bytes) -> dict:
+        """Traite une ligne de requête et retourne la réponse"""
+        try:
+            request = loads(line)
+        except ValueError:
+            return {'ok': False, 'error': "Invalid JSON"}
+        try:
+            if not isinstance(request, dict) or not isinstance(name := request.get('command'), str) \
+                    or (command := self._commands.get(name)) is None:
+                raise ProtocolError("Unknown command")
+            response = {'ok': True, **command(request)}
+        except ProtocolError as e:
+            response = {'ok': False, 'error': str(e)}
+        if isinstance(request, dict) and 'id' in request:
+            response['id'] = request['id']
+        return response
+
+    async def _expire_sessions(self) -> None:
+        """Retire régulièrement les parties inactives"""
+        while True:
+            await asyncio.sleep(min(EXPIRY_INTERVAL, self.store.idle_timeout))
+            self.store.expire()
+
+    async def serve(self) -> None:
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(lambda: ClientProtocol(self), self.host, self.port, backlog=BACKLOG)
+        host, port = server.sockets[0].getsockname()[:2]
+        self.view.show_start(host, port, self.store.max_sessions, self.store.idle_timeout)
+        ServerController.log.info(f"Serving on {host}:{port}")
+        expiry = asyncio.create_task(self._expire_sessions())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            expiry.cancel()
+
+    def run(self) -> None:
+        """Lance le serveur jusqu'à son interruption (Ctrl+C)"""
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            pass
+        self.view.show_stop(len(self.store))
@@ -0,0 +1,104 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from random import Random
+from secrets import randbits
+from time import perf_counter
+
+import numpy as np
+
+from mastermind.model.game import Mastermind
+from mastermind.model.scoring import random_codes
+from mastermind.solver.consistent import ConsistentSolver
+from mastermind.solver.entropy import EntropySolver
+from mastermind.solver.knuth import KnuthSolver
+from mastermind.solver.strategy import Strategy
+from mastermind.utils.logger import quiet_game_log
+from mastermind.utils.parameters import Level, Solver, Try
+from mastermind.views.simulation import Simulation
+
+# Nombre de parties jouées par un processus avant de remonter ses statistiques
+GAMES_PER_CHUNK = 2000
+# Nombre de lots en cours par processus, pour borner la mémoire sur des millions de parties
+CHUNKS_PER_WORKER = 2
+# Délai minimal, en secondes, entre deux affichages de la progression
+PROGRESS_INTERVAL = 1.0
+
+
+def init_worker() -> None:
+    """Prépare un processus de simulation, qui peut ne pas hériter du paramétrage du journal"""
+    quiet_game_log()
+
+
+def get_strategy(solver: Solver, model: Mastermind) -> Strategy:
+    """Retourne une instance de la stratégie demandée, adaptée à la partie.
+    Les simulations étant déjà réparties entre processus, l'entropie reste mono-processus"""
+    match solver:
+        case Solver.RANDOM:
+            return ConsistentSolver.from_game(model)
+        case Solver.KNUTH:
+            return KnuthSolver.from_game(model)
+        case Solver.ENTROPY:
+            return EntropySolver(model.codebook.colors, model.codebook.size, workers=1)
+
+
+def play_games(level: Level, tries: Try, solver: Solver, games: int, seed: tuple[int, int]) -> list[int]:
+    """Joue des parties sans interface avec un modèle et une stratégie réutilisés.
+    Les secrets du lot sont tirés d'un bloc et tout l'aléa du lot découle de sa graine
+    (graine de la simulation, numéro du lot) : le résultat ne dépend pas du processus qui le joue.
+    Retourne l'histogramme des parties : l'index est le nombre d'essais
+    d'une partie gagnée, l'index 0 compte les parties perdues"""
+    generator = np.random.default_rng(seed)
+    model = Mastermind(level, tries, rng=Random(int(generator.integers(1 << 63))))
+    strategy = get_strategy(solver, model)
+    histogram = [0] * (tries.value + 1)
+    for secret in random_codes(games, model.codebook.colors, model.codebook.size, generator).tolist():
+        model.init_new_game(level, tries, secret=secret)
+        strategy.reset()
+        while not model.game_over:
+            guess = strategy.next_code()
+            strategy.observe(guess, model.evaluate_code(guess))
+        histogram[tries.value - model.remaining_tries if model.win else 0] += 1
+    return histogram
+
+
+class SimulationController:
+    def __init__(self, level: Level, tries: Try, solver: Solver,
+                 games: int, workers: int, view: Simulation, seed: int | None = None) -> None:
+        """Sans graine, une graine est tirée puis affichée pour pouvoir rejouer la simulation"""
+        self.level = level
+        self.tries = tries
+        self.solver = solver
+        self.games = games
+        self.workers = workers
+        self.view = view
+        self.seed = randbits(32) if seed is None else seed
+        self.histogram = [0] * (tries.value + 1)
+
+    def _chunks(self):
+        """Découpe le nombre total de parties en lots, chacun avec sa graine"""
+        for chunk, start in enumerate(range(0, self.games, GAMES_PER_CHUNK)):
+            yield min(GAMES_PER_CHUNK, self.games - start), (self.seed, chunk)
+
+    def _merge(self, histogram: list[int]) -> None:
+        self.histogram = [total + count for total, count in zip(self.histogram, histogram)]
+
+    def run(self) -> None:
+        """Répartit les parties entre les processus et diffuse les statistiques agrégées"""
+        self.view.show_start(self.games, self.level, self.tries, self.solver, self.workers, self.seed)
+        start_time = last_display = perf_counter()
+        chunks = self._chunks()
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker) as executor:
+            pending = set()
+            while True:
+                for games, seed in chunks:
+                    pending.add(executor.submit(play_games, self.level, self.tries, self.solver, games, seed))
+                    if len(pending) >= self.workers * CHUNKS_PER_WORKER:
+                        break
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._merge(future.result())
+                if perf_counter() - last_display >= PROGRESS_INTERVAL:
+                    last_display = perf_counter()
+                    self.view.show_progress(self.histogram, last_display - start_time)
+        self.view.show_summary(self.histogram, perf_counter() - start_time)
@@ -1,6 +1,7 @@
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool
 from PySide6.QtGui import QKeyEvent
 
+from mastermind.controllers.hint_worker import HintWorker
 from mastermind.model.game import Mastermind
 from mastermind.model.language import get_translation, get_help
 from mastermind.model.settings import Config
@@ -15,36 +16,62 @@ class WindowController:
         self.model = model
         self.config = config
         self.view = view
+        # Numéro de la dernière demande d'indice : un résultat plus ancien est ignoré
+        self.hint_request = 0
+        self.hint_worker: HintWorker | None = None
+
+    def _cancel_hint(self) -> None:
+        """Annule le calcul d'indice en cours et efface l'indice affiché"""
+        self.hint_request += 1
+        if self.hint_worker is not None:
+            self.hint_worker.cancel()
+            self.hint_worker = None
+        self.view.display_hint("")
 
     def _change_language(self, language: str) -> None:
         new_language = Language.from_string(language)
         self.config.language = new_language
         self.view.setup_ui_translation(self._get_translations(new_language))
+        self._display_remaining()
 
-    def _close_view(self) -> None:
-        """Fermeture de la fenêtre de jeu"""
-        self.view.game_in_progress = False
-        self.view.close()
+    def _display_remaining(self) -> None:
+        """Met à jour sur la vue le nombre de combinaisons encore possibles"""
+        self.view.display_remaining(get_translation(self.config.language, 'remaining_combinations').format(
+            count=self.model.remaining_count
+        ))
 
     def _evaluate_combination(self, combination: tuple[Color]) -> None:
         """Obtient du modèle les indices associés à la combinaison évaluée
         et met à jour la vue en conséquence"""
+        # Les Color transmises par un Signal(list) arrivent converties en str
+        combination = tuple(map(Color, combination))
+        self._cancel_hint()
         if (clues := self.model.evaluate_combinaison(combination)) is None:
             return
         self.view.display_clues(clues)
         self.view.deactivate_row()
+        self._display_remaining()
         if self._is_game_over():
             self.view.game_in_progress = False
-            self.view.display_game_over(self._is_win())
+            self.view.display_game_over(self._is_win(), self.model.secret_combination)
         else:
             self.view.game_in_progress = True
             self.view.activate_next_try()
 
+    def _display_hint(self, request: int, code: int) -> None:
+        """Affiche l'essai conseillé, s'il répond à la dernière demande"""
+        if request != self.hint_request:
+            return
+        self.hint_worker = None
+        self.view.display_hint(get_translation(self.config.language, 'hint_result'),
+                               self.model.codebook.decode(code))
+
     def _get_translations(self, lang: Language) -> dict:
         return {
             'main_title': get_translation(lang, 'main_window_title'),
             'select_color': get_translation(lang, 'select_color_window'),
             'submit_button': get_translation(lang, 'submit'),
+            'hint_button': get_translation(lang, 'hint'),
             'help_button': get_translation(lang, 'help'),
             'new_game': get_translation(lang, 'new_game'),
             'quit_button': get_translation(lang, 'quit'),
@@ -57,9 +84,11 @@ class WindowController:
             'tries': get_translation(lang, 'tries'),
             'nb_colors_availables': get_translation(lang, 'nb_colors_availables'),
             'nb_max_tries': get_translation(lang, 'nb_max_tries'),
+            'evil_mode': get_translation(lang, 'evil_mode'),
             'EASY': get_translation(lang, 'EASY'),
             'NORMAL': get_translation(lang, 'NORMAL'),
             'HARD': get_translation(lang, 'HARD'),
+            'PRACTICE': get_translation(lang, 'PRACTICE'),
             'win_message': get_translation(lang, 'win_window'),
             'lose_message': get_translation(lang, 'lose_window'),
         }
@@ -71,6 +100,8 @@ class WindowController:
         self.view.event_keyboard.connect(self._parse_input)
         self.view.restart.connect(self._new_game)
         self.view.show_rules.connect(self._show_rules)
+        self.view.request_hint.connect(self._request_hint)
+        self.view.closed.connect(self._cancel_hint)
 
     def _is_game_over(self) -> bool:
         """Retourne True si la partie est terminée"""
@@ -89,17 +120,17 @@ class WindowController:
                            self._get_translations(self.config.language))
 
     def _new_game(self) -> None:
-        """Chargement d'une nouvelle fenêtre de jeu"""
+        """Nouvelle partie sur le plateau de la fenêtre de jeu existante"""
         if self.view.game_in_progress and not self.view.confirmation_interruption():
             return
-        dialog = NewGame(self.view, self.model.level, self.model.max_tries)
+        dialog = NewGame(self.view, self.model.level, self.model.max_tries, self.model.evil)
         if dialog.exec():
-            level, tries = dialog.get_params_new_game()
+            level, tries, evil = dialog.get_params_new_game()
             self.config.level, self.config.tries = level, tries
-            self.model.init_new_game(level, tries)
-            self._close_view()
-            self.view = MainWindow()
-            self.run()
+            self._cancel_hint()
+            self.model.init_new_game(level, tries, evil)
+            self.view.reset(tries.value, level.value, self.model.secret_combination)
+            self._display_remaining()
 
     def _parse_input(self, event: QKeyEvent) -> None:
         """Déclenche, sur la vue, l'action associée à l'entrée clavier"""
@@ -111,17 +142,30 @@ class WindowController:
                     self._new_game()
                 case Qt.Key_E:
                     self._show_rules()
+                case Qt.Key_H:
+                    self._request_hint()
         elif not self._is_game_over():
             match event.key():
                 case num if 49 <= num <= 48 + self.model.level.value:
                     self.view.positioned_color(Color.from_index(event.key() - 49))
                 case Qt.Key_Right:
-                    self.view.rows[self.view.num_row_enabled].select_neighbor_try_piece(Neighbor.RIGHT)
+                    self.view.select_neighbor(Neighbor.RIGHT)
                 case Qt.Key_Left:
-                    self.view.rows[self.view.num_row_enabled].select_neighbor_try_piece(Neighbor.LEFT)
+                    self.view.select_neighbor(Neighbor.LEFT)
                 case Qt.Key_Return | Qt.Key_Enter:
                     self.view.validate_combinaison()
 
+    def _request_hint(self) -> None:
+        """Lance en arrière-plan le calcul du prochain essai conseillé"""
+        if self._is_game_over():
+            return
+        self._cancel_hint()
+        self.hint_worker = HintWorker(self.hint_request, self.model.codebook.colors,
+                                      self.model.codebook.size, self.model.history)
+        self.hint_worker.signals.found.connect(self._display_hint, Qt.ConnectionType.QueuedConnection)
+        self.view.display_hint(get_translation(self.config.language, 'hint_searching'))
+        QThreadPool.globalInstance().start(self.hint_worker)
+
     def _show_rules(self) -> None:
         help_text = {
             'close_button': get_translation(self.config.language, 'close'),
@@ -135,5 +179,6 @@ class WindowController:
     def run(self) -> None:
         """Affiche la fenêtre principale"""
         self._load_ui()
+        self._display_remaining()
         self._init_reception_signal()
         self.view.show()
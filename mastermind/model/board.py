@@ -0,0 +1,108 @@
+from typing import Callable
+
+from mastermind.model.settings import SIZE_COMBINATION
+from mastermind.utils.parameters import Color, Neighbor
+
+
+class Board:
+    """État du plateau : ligne active, pion sélectionné, couleurs et indices de chaque ligne.
+    Chaque modification est en O(1) et notifiée aux abonnés, qui ne redessinent
+    que le pion (peg_listeners) ou la ligne (row_listeners) concerné"""
+    def __init__(self, max_tries: int, size: int = SIZE_COMBINATION) -> None:
+        self.size = size
+        self.peg_listeners: list[Callable[[int, int], None]] = []
+        self.row_listeners: list[Callable[[int], None]] = []
+        self.max_tries = max_tries
+        self.active_row = 0
+        self.selected: int | None = 0
+        self.playing = True
+        # Seules les lignes jouées et la ligne active sont stockées, les suivantes sont vides
+        self._colors: list[list[Color]] = [[Color.GRAY] * size]
+        self._clues: list[tuple[Color, ...]] = [()]
+        self._missing = size
+
+    def _notify_peg(self, row: int, index: int) -> None:
+        for listener in self.peg_listeners:
+            listener(row, index)
+
+    def _notify_row(self, row: int) -> None:
+        for listener in self.row_listeners:
+            listener(row)
+
+    def reset(self, max_tries: int) -> None:
+        """Nouvelle partie : seules les lignes déjà jouées sont notifiées"""
+        played = len(self._colors)
+        self.max_tries = max_tries
+        self.active_row = 0
+        self.selected = 0
+        self.playing = True
+        self._colors = [[Color.GRAY] * self.size]
+        self._clues = [()]
+        self._missing = self.size
+        for row in range(min(played, max_tries)):
+            self._notify_row(row)
+
+    def color(self, row: int, index: int) -> Color:
+        return self._colors[row][index] if row < len(self._colors) else Color.BLACK
+
+    def clues(self, row: int) -> tuple[Color, ...]:
+        return self._clues[row] if row < len(self._clues) else ()
+
+    def is_selected(self, row: int, index: int) -> bool:
+        return row == self.active_row and index == self.selected
+
+    @property
+    def is_complete(self) -> bool:
+        """Retourne True si une couleur a été appliquée à chaque pion de la ligne active"""
+        return self._missing == 0
+
+    def combination(self) -> tuple[Color, ...]:
+        """Retourne les couleurs de la ligne active"""
+        return tuple(self._colors[self.active_row])
+
+    def select(self, index: int) -> None:
+        """Sélectionne un pion de la ligne active"""
+        if not self.playing or index == self.selected:
+            return
+        previous, self.selected = self.selected, index
+        if previous is not None:
+            self._notify_peg(self.active_row, previous)
+        self._notify_peg(self.active_row, index)
+
+    def select_neighbor(self, neighbor: Neighbor) -> None:
+        """Sélectionne le pion qui suit ou précède le pion sélectionné"""
+        if self.selected is not None:
+            self.select((self.selected + (1 if neighbor == Neighbor.RIGHT else -1)) % self.size)
+
+    def place(self, color: Color) -> None:
+        """Applique une couleur au pion sélectionné puis sélectionne le suivant"""
+        if not self.playing or self.selected is None:
+            return
+        row = self._colors[self.active_row]
+        self._missing += (color == Color.GRAY) - (row[self.selected] == Color.GRAY)
+        row[self.selected] = color
+        self._notify_peg(self.active_row, self.selected)
+        self.select_neighbor(Neighbor.RIGHT)
+
+    def set_clues(self, clues: tuple[Color, ...]) -> None:
+        """Associe des indices à la ligne active"""
+        self._clues[self.active_row] = tuple(clues)
+        self._notify_row(self.active_row)
+
+    def deactivate_row(self) -> None:
+        """Désactive la ligne active, plus aucun pion n'est sélectionné"""
+        self.playing = False
+        self.selected = None
+        self._notify_row(self.active_row)
+
+    def activate_next_row(self) -> None:
+        """Active la ligne suivante et sélectionne son premier pion"""
+        if self.active_row + 1 >= self.max_tries:
+            return
+        self.active_row += 1
+        self.selected = 0
+        self.playing = True
+        self._colors.append([Color.GRAY] * self.size)
+        self._clues.append(())
+        self._missing = self.size
+        self._notify_row(self.active_row)
@@ -0,0 +1,150 @@
+from functools import cache, cached_property, lru_cache
+from itertools import product
+
+from .settings import SIZE_COMBINATION
+from mastermind.utils.parameters import COLOR_INDEX, Color
+
+# Une combinaison compacte : les index des couleurs de chaque pion,
+# le premier pion étant le chiffre le plus significatif en base 'nombre de couleurs'
+Code = int
+
+# Touche de chaque couleur lors d'une saisie en chiffres, la dixième couleur se saisit avec 0
+KEYS = "1234567890"
+_KEY_INDEX = {key: index for index, key in enumerate(KEYS)}
+
+# Au-delà de ce nombre de codes, chiffres, positions et histogrammes ne sont plus
+# précalculés pour chaque code mais recalculés à la demande
+PRECOMPUTED_CODES = 1 << 16
+# Nombre maximal de codes pour lequel la table des indices (codes x codes octets) est construite,
+# au-delà les candidats sont parcourus en flux (voir scoring.CombinationStream)
+MAX_TABLE_CODES = 1 << 13
+
+
+def pack_feedback(red: int, white: int) -> int:
+    """Encode les indices (rouges, blancs) sur un octet"""
+    return red << 4 | white
+
+
+def unpack_feedback(value: int) -> tuple[int, int]:
+    """Décode un octet d'indices en (rouges, blancs)"""
+    return value >> 4, value & 0xF
+
+
+class CodeBook:
+    """Encodage compact des combinaisons pour un nombre de couleurs donné.
+    Précalcule les chiffres, les positions et l'histogramme des couleurs de chaque code,
+    les index des codes suivent l'ordre de scoring.all_combinations.
+    Pour les grands espaces (voir PRECOMPUTED_CODES), rien n'est précalculé"""
+    def __init__(self, colors: int, size: int = SIZE_COMBINATION) -> None:
+        self.colors = colors
+        self.size = size
+        self.count = colors ** size
+        self.palette: tuple[Color, ...] = tuple(Color)[:colors]
+        self.win_feedback = pack_feedback(size, 0)
+        self.precomputed = self.count <= PRECOMPUTED_CODES
+        if self.precomputed:
+            self._precompute()
+
+    def _precompute(self) -> None:
+        """Précalcule les chiffres, positions et histogrammes de tous les codes"""
+        # Bitset de tous les codes (bit i pour le code i)
+        self.full_set = (1 << self.count) - 1
+        colors, size = self.colors, self.size
+        self.digits: tuple[tuple[int, ...], ...] = tuple(product(range(colors), repeat=size))
+        # Masques précalculés : un bit par (position, couleur) pour les rouges,
+        # et pour chaque couleur un bloc de 'size' bits remplis en unaire selon son nombre
+        # d'occurrences, de sorte que popcount(a & b) = somme des min des histogrammes.
+        # Les bits de position étant disjoints, leur somme vaut leur union
+        self.positions: tuple[int, ...] = tuple(map(sum, product(
+            *([1 << (position * colors + digit) for digit in range(colors)] for position in range(size))
+        )))
+        histogram = cache(self._histogram)
+        self.histograms: tuple[int, ...] = tuple(histogram(tuple(sorted(digits))) for digits in self.digits)
+
+    def _histogram(self, digits: tuple[int, ...]) -> int:
+        """Retourne le masque unaire de l'histogramme des couleurs"""
+        return sum(((1 << digits.count(color)) - 1) << (color * self.size) for color in set(digits))
+
+    @property
+    def has_table(self) -> bool:
+        """Retourne True si la table des indices peut être construite pour ces codes"""
+        return self.count <= MAX_TABLE_CODES
+
+    def digits_of(self, code: Code) -> tuple[int, ...]:
+        """Retourne les index des couleurs de chaque pion du code"""
+        if self.precomputed:
+            return self.digits[code]
+        digits = [0] * self.size
+        for position in range(self.size - 1, -1, -1):
+            code, digits[position] = divmod(code, self.colors)
+        return tuple(digits)
+
+    def is_valid(self, combination: tuple[Color, ...]) -> bool:
+        """Retourne True si la combinaison peut être encodée"""
+        return len(combination) == self.size and set(combination) <= set(self.palette)
+
+    def encode(self, combination: tuple[Color, ...]) -> Code:
+        """Retourne le code entier correspondant à une combinaison de Color ou de leurs codes hexadécimaux.
+        La combinaison doit être valide (voir is_valid)"""
+        code = 0
+        for color in combination:
+            code = code * self.colors + COLOR_INDEX[color]
+        return code
+
+    @cached_property
+    def _typed(self) -> tuple[str, ...]:
+        """Saisie en chiffres de chaque code, construite au premier besoin pour un espace précalculé"""
+        return tuple("".join(KEYS[digit] for digit in digits) for digits in self.digits)
+
+    @cached_property
+    def typed_codes(self) -> dict[str, Code]:
+        """Code de chaque saisie en chiffres (voir _typed), pour les espaces précalculés uniquement.
+        Sa méthode get est la variante la plus rapide de parse"""
+        return {typed: code for code, typed in enumerate(self._typed)}
+
+    def parse(self, typed: str) -> Code | None:
+        """Retourne le code d'une combinaison saisie en chiffres (voir KEYS), None si elle est invalide"""
+        if self.precomputed:
+            return self.typed_codes.get(typed)
+        if len(typed) != self.size:
+            return None
+        code = 0
+        for key in typed:
+            if (digit := _KEY_INDEX.get(key, self.colors)) >= self.colors:
+                return None
+            code = code * self.colors + digit
+        return code
+
+    def format(self, code: Code) -> str:
+        """Retourne la saisie en chiffres d'un code (voir KEYS)"""
+        if self.precomputed:
+            return self._typed[code]
+        return "".join(KEYS[digit] for digit in self.digits_of(code))
+
+    def decode(self, code: Code) -> tuple[Color, ...]:
+        """Retourne la combinaison de Color correspondant au code"""
+        return tuple(self.palette[digit] for digit in self.digits_of(code))
+
+    def score(self, guess: Code, secret: Code) -> tuple[int, int]:
+        """Retourne le nombre d'indices rouges et blancs de l'essai face au secret"""
+        if not self.precomputed:
+            guess_digits, secret_digits = self.digits_of(guess), self.digits_of(secret)
+            red = sum(map(int.__eq__, guess_digits, secret_digits))
+            common = sum(min(guess_digits.count(color), secret_digits.count(color)) for color in set(guess_digits))
+            return red, common - red
+        red = (self.positions[guess] & self.positions[secret]).bit_count()
+        return red, (self.histograms[guess] & self.histograms[secret]).bit_count() - red
+
+
+    def feedback(self, guess: Code, secret: Code) -> int:
+        """Variante de score qui retourne directement l'octet d'indices (voir pack_feedback)"""
+        if not self.precomputed:
+            return pack_feedback(*self.score(guess, secret))
+        red = (self.positions[guess] & self.positions[secret]).bit_count()
+        return red << 4 | ((self.histograms[guess] & self.histograms[secret]).bit_count() - red)
+
+
+@lru_cache
+def get_codebook(colors: int, size: int = SIZE_COMBINATION) -> CodeBook:
+    """Retourne le CodeBook partagé pour un nombre de couleurs donné"""
+    return CodeBook(colors, size)
@@ -0,0 +1,119 @@
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from struct import Struct
+from zlib import crc32
+
+import numpy as np
+
+from .code import Code, MAX_TABLE_CODES, pack_feedback
+from .scoring import all_combinations, evaluate_batch
+from .settings import SIZE_COMBINATION
+from mastermind.utils.dir import Dir
+from mastermind.utils.logger import setup_logger
+from mastermind.utils.parameters import Level
+
+VERSION = 1
+MAGIC = b"MMFB"
+# magic, version, nombre de couleurs, taille des combinaisons, nombre de codes, checksum
+HEADER = Struct("<4sHBBII")
+
+
+class FeedbackTable:
+    """Table essai x secret des indices, stockée sur disque et projetée en mémoire.
+    Les index des lignes et colonnes sont les codes compacts (voir code.CodeBook).
+    Limitée à code.MAX_TABLE_CODES codes, au-delà voir scoring.CombinationStream"""
+    log = setup_logger("feedback_table")
+
+    def __init__(self, colors: int, size: int = SIZE_COMBINATION) -> None:
+        self.colors = colors
+        self.size = size
+        self.count = colors ** size
+        if self.count > MAX_TABLE_CODES:
+            raise ValueError(f"Too many codes for a feedback table: {colors}^{size}")
+        self.path = Dir.CACHE / f"feedback_{colors}x{size}.bin"
+        if not self._is_valid():
+            self._build()
+        self.table = np.memmap(self.path, dtype=np.uint8, mode='r',
+                               offset=HEADER.size, shape=(self.count, self.count))
+
+    def _expected_header(self, checksum: int) -> bytes:
+        return HEADER.pack(MAGIC, VERSION, self.colors, self.size, self.count, checksum)
+
+    def _is_valid(self) -> bool:
+        """Retourne True si le fichier existe, a la taille attendue et correspond à la version courante.
+        Seul l'en-tête est lu : l'intégrité du contenu n'est contrôlée que par verify"""
+        try:
+            with open(self.path, 'rb') as file:
+                header = file.read(HEADER.size)
+                file_size = os.fstat(file.fileno()).st_size
+        except FileNotFoundError:
+            return False
+        if len(header) != HEADER.size or file_size != HEADER.size + self.count * self.count:
+            FeedbackTable.log.warning(f"Truncated feedback table: {self.path}")
+            return False
+        if header[:-4] != self._expected_header(0)[:-4]:
+            FeedbackTable.log.warning(f"Stale feedback table: {self.path}")
+            return False
+        return True
+
+    def verify(self) -> bool:
+        """Relit toute la table et compare son checksum à celui de l'en-tête.
+        Une table corrompue est reconstruite, retourne False dans ce cas"""
+        with open(self.path, 'rb') as file:
+            checksum = HEADER.unpack(file.read(HEADER.size))[-1]
+        if crc32(self.table) == checksum:
+            return True
+        FeedbackTable.log.warning(f"Corrupted feedback table: {self.path}")
+        self._build()
+        self.table = np.memmap(self.path, dtype=np.uint8, mode='r',
+                               offset=HEADER.size, shape=(self.count, self.count))
+        return False
+
+    def _build(self) -> None:
+        """Calcule la table et l'écrit de façon atomique"""
+        FeedbackTable.log.info(f"Building feedback table {self.colors}x{self.size}")
+        combinations = all_combinations(self.colors, self.size)
+        red, white = evaluate_batch(combinations, combinations, self.colors)
+        data = pack_feedback(red, white).tobytes()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = Path(f"{self.path}.{os.getpid()}.tmp")
+        with open(temp_path, 'wb') as file:
+            file.write(self._expected_header(crc32(data)))
+            file.write(data)
+        os.replace(temp_path, self.path)
+
+    def feedback(self, guess: int, secret: int) -> int:
+        """Retourne l'octet d'indices de l'essai face au secret"""
+        return int(self.table[guess, secret])
+
+    def row(self, guess: int) -> np.ndarray:
+        """Retourne les indices de l'essai face à chaque secret possible"""
+        return self.table[guess]
+
+    def partition(self, guess: Code, candidates: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Répartit les secrets candidats selon les indices qu'ils donneraient à l'essai.
+        Retourne l'octet d'indices de chaque candidat et la taille de chaque classe, indexée par l'octet"""
+        classes = self.table[guess].take(candidates)
+        return classes, np.bincount(classes, minlength=pack_feedback(self.size, 0) + 1)
+
+    def consistent(self, guess: Code, feedback: int) -> int:
+        """Retourne le bitset (bit i pour le code i) des secrets
+        pour lesquels l'essai aurait produit ces indices"""
+        return int.from_bytes(np.packbits(self.table[guess] == feedback, bitorder='little').tobytes(), 'little')
+
+
+@lru_cache
+def get_feedback_table(colors: int, size: int = SIZE_COMBINATION) -> FeedbackTable:
+    """Retourne la table partagée, construite ou projetée au premier appel"""
+    return FeedbackTable(colors, size)
+
+
+if __name__ == '__main__':
+    # python -m mastermind.model.feedback_table [verify] : construit les tables des niveaux,
+    # et vérifie en plus l'intégrité de leur contenu avec verify
+    for level in Level:
+        table = get_feedback_table(level.value)
+        if sys.argv[1:] == ['verify']:
+            print(f"{level}: {'ok' if table.verify() else 'corrupted, rebuilt'}")
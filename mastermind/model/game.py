@@ -1,58 +1,191 @@
 import logging
-from random import choice, shuffle
+from array import array
+from random import Random
+from typing import Iterator
 
+from .code import Code, get_codebook, pack_feedback, unpack_feedback
 from .settings import SIZE_COMBINATION
-from mastermind.utils.logger import setup_logger
+from mastermind.utils.logger import GAME_LOGGER, setup_logger
 from mastermind.utils.parameters import Level, Color, Try
 
+# Générateur des parties créées sans générateur propre (voir Mastermind). Un générateur par partie
+# coûterait plus de 2 Ko à chacune, bien plus que la partie elle-même
+SHARED_RNG = Random()
+# Historique d'une partie sans essai, partagé : le tableau d'une partie n'est créé qu'à son premier essai
+NO_MOVES = ()
 
-def shuffle_items_list(list_color: list) -> tuple:
-    """Mélanger aléatoirement les éléments d'une liste donnée"""
-    shuffle(list_color)
+
+def shuffle_items_list(list_color: list, rng: Random) -> tuple:
+    """Mélanger aléatoirement les éléments d'une liste donnée avec le générateur de la partie"""
+    rng.shuffle(list_color)
     return tuple(list_color)
 
 
 class Mastermind:
-    log = setup_logger("game", logging.INFO)
+    """État d'une partie. Sans __dict__ et sans donnée propre à la partie hors du strict nécessaire :
+    secret et essais sont des entiers compacts, les couleurs et codes sont partagés
+    par toutes les parties d'une même configuration (voir code.get_codebook)"""
+    log = setup_logger(GAME_LOGGER, logging.INFO)
+    __slots__ = ('evil', 'colors', 'size', 'level', 'max_tries', 'remaining_tries', 'game_over', 'win',
+                 'codebook', 'rng', '_moves', '_candidates', '_narrowed', '_evil_candidates', '_secret')
 
-    def __init__(self, level: Level, tries_number: Try) -> None:
+    def __init__(self, level: Level, tries_number: Try, evil: bool = False,
+                 colors: int | None = None, size: int = SIZE_COMBINATION, rng: Random | None = None) -> None:
+        """colors, s'il est donné, remplace le nombre de couleurs du niveau
+        et size est le nombre de pions d'une combinaison.
+        rng tire secrets et indices : initialisé avec une graine, il rend les parties reproductibles.
+        Sans générateur propre, la partie utilise SHARED_RNG"""
+        self.evil = evil
+        self.colors = colors
+        self.size = size
+        self.rng = SHARED_RNG if rng is None else rng
         self.init_new_game(level, tries_number)
 
+    @property
+    def available_colors(self) -> tuple[Color, ...]:
+        """Couleurs de la partie, partagées par toutes les parties de même nombre de couleurs"""
+        return self.codebook.palette
+
+    @property
+    def history(self) -> list[tuple[Code, int]]:
+        """Essais joués (code, octet d'indices), dans l'ordre"""
+        return [(move >> 8, move & 0xFF) for move in self._moves]
+
+    @property
+    def secret_code(self) -> Code:
+        """Retourne le code compact de la combinaison secrète"""
+        return self._secret
+
     @property
     def secret_combination(self) -> tuple[Color, ...]:
         """Retourne la combinaison secrète de la partie"""
-        return self._secret
+        return self.codebook.decode(self._secret)
 
-    def _generate_combinaison(self) -> tuple[Color, ...]:
-        """Générer une liste de Color aléatoire"""
-        return tuple(choice(self.available_colors) for _ in range(SIZE_COMBINATION))
+    def _generate_combinaison(self) -> Code:
+        """Générer une combinaison aléatoire sous forme de code compact"""
+        return self.rng.randrange(self.codebook.count)
 
-    def _update_game_status(self, clues: list[Color]) -> None:
+    def _digits_history(self) -> list[tuple[tuple[int, ...], int]]:
+        """Retourne l'historique avec les essais sous forme de chiffres, pour le parcours en flux"""
+        return [(self.codebook.digits_of(guess), feedback) for guess, feedback in self.history]
+
+    def _choose_evil_secret(self, guess: Code) -> Code:
+        """Mode adversaire : garde la classe d'indices qui laisse le plus de secrets possibles
+        face à l'essai et retourne un secret de cette classe, qui devient le secret courant"""
+        if not self.codebook.has_table:
+            return self._choose_evil_secret_streamed(guess)
+        import numpy as np
+        from .feedback_table import get_feedback_table
+        if self._evil_candidates is None:
+            self._evil_candidates = np.arange(self.codebook.count, dtype=np.intp)
+        table = get_feedback_table(self.codebook.colors, self.codebook.size)
+        classes, sizes = table.partition(guess, self._evil_candidates)
+        # La victoire n'est concédée que si aucune autre classe n'est aussi grande
+        scores = sizes * 2
+        scores[self.codebook.win_feedback] -= 1
+        self._evil_candidates = self._evil_candidates[classes == scores.argmax()]
+        return int(self._evil_candidates[self.rng.randrange(len(self._evil_candidates))])
+
+    def _choose_evil_secret_streamed(self, guess: Code) -> Code:
+        """Variante de _choose_evil_secret sans table : les candidats sont parcourus en flux,
+        une fois pour mesurer les classes et une fois pour tirer le secret"""
+        from .scoring import get_stream
+        stream = get_stream(self.codebook.colors, self.codebook.size)
+        history = self._digits_history()
+        sizes = stream.partition(self.codebook.digits_of(guess), history)
+        scores = sizes * 2
+        scores[self.codebook.win_feedback] -= 1
+        feedback = int(scores.argmax())
+        return stream.nth(history + [(self.codebook.digits_of(guess), feedback)], self.rng.randrange(sizes[feedback]))
+
+    def _narrow_candidates(self) -> None:
+        """Applique au bitset des candidats les essais de l'historique
+        qui n'ont pas encore été pris en compte"""
+        if self._narrowed == len(self._moves):
+            return
+        from .feedback_table import get_feedback_table
+        table = get_feedback_table(self.codebook.colors, self.codebook.size)
+        for move in self._moves[self._narrowed:]:
+            self._candidates &= table.consistent(move >> 8, move & 0xFF)
+        self._narrowed = len(self._moves)
+
+    @property
+    def remaining_count(self) -> int:
+        """Nombre de combinaisons encore compatibles avec les essais joués"""
+        if not self._moves:
+            return self.codebook.count
+        if not self.codebook.has_table:
+            from .scoring import get_stream
+            return get_stream(self.codebook.colors, self.codebook.size).count_consistent(self._digits_history())
+        self._narrow_candidates()
+        return self._candidates.bit_count()
+
+    def candidates(self) -> Iterator[tuple[Color, ...]]:
+        """Parcourt les combinaisons encore compatibles avec les essais joués"""
+        if not self.codebook.has_table:
+            from .scoring import get_stream
+            stream = get_stream(self.codebook.colors, self.codebook.size)
+            for codes in stream.consistent(self._digits_history()):
+                yield from map(self.codebook.decode, codes.tolist())
+            return
+        self._narrow_candidates()
+        bits = self._candidates
+        while bits:
+            lowest = bits & -bits
+            yield self.codebook.decode(lowest.bit_length() - 1)
+            bits ^= lowest
+
+    def _update_game_status(self, feedback: int) -> None:
         """Met à jour le status de la partie (terminée ou non)
         et dans quel état (gagnée ou perdue)."""
-        self.win = clues.count(Color.RED) == SIZE_COMBINATION
+        self.win = feedback == self.codebook.win_feedback
         self.game_over = self.win or not self.remaining_tries
         if self.game_over:
-            Mastermind.log.info(f"Game {'won' if self.win else 'lost'}")
+            Mastermind.log.info("Game %s", 'won' if self.win else 'lost')
 
     def evaluate_combinaison(self, combination: tuple[Color, ...]) -> tuple[Color] | None:
         """Retourne une liste de Color représentant des indices déterminés en
         comparant la combinaison passée en paramètre et combinaison secrète."""
-        if len(combination) == SIZE_COMBINATION and set(combination) <= set(self.available_colors):
-            self.remaining_tries -= 1
-            red = sum(s == c for s, c in zip(self._secret, combination, strict=False))
-            white = sum(min(self._secret.count(c), combination.count(c)) for c in set(combination)) - red
-            evaluation = [Color.RED] * red + [Color.WHITE] * white
-            self._update_game_status(evaluation)
-            return shuffle_items_list(evaluation)
-
-    def init_new_game(self, level: Level, max_tries: Try) -> None:
-        """Initialiser les attributs pour commencer une nouvelle partie"""
+        if self.codebook.is_valid(combination):
+            red, white = unpack_feedback(self.evaluate_code(self.codebook.encode(combination)))
+            return shuffle_items_list([Color.RED] * red + [Color.WHITE] * white, self.rng)
+
+    def evaluate_code(self, guess: Code) -> int:
+        """Évalue un essai déjà encodé et retourne l'octet d'indices (voir pack_feedback).
+        Variante de evaluate_combinaison sans conversion de Color, pour les parties sans interface"""
+        self.remaining_tries -= 1
+        if self.evil:
+            self._secret = self._choose_evil_secret(guess)
+        feedback = self.codebook.feedback(guess, self._secret)
+        if not self._moves:
+            self._moves = array('Q')
+        self._moves.append(guess << 8 | feedback)
+        self._update_game_status(feedback)
+        return feedback
+
+    def init_new_game(self, level: Level, max_tries: Try, evil: bool | None = None,
+                      secret: Code | None = None) -> None:
+        """Initialiser les attributs pour commencer une nouvelle partie.
+        Sans valeur pour evil, le mode de la partie précédente est conservé.
+        Sans secret imposé (pour rejouer une partie), il est tiré au hasard"""
+        if evil is not None:
+            self.evil = evil
         self.level = level
         self.max_tries = max_tries
         self.remaining_tries: int = self.max_tries.value
         self.game_over = self.win = False
-        self.available_colors = tuple(Color)[:self.level.value]
-        self._secret = self._generate_combinaison()
-        Mastermind.log.info(f"New game: level {self.level}, tries {self.max_tries}")
-        Mastermind.log.debug(f"Combination : {" ".join(color.name for color in self._secret)}")
+        self.codebook = get_codebook(self.colors or self.level.value, self.size)
+        # Essais joués, un entier 'code << 8 | octet d'indices' chacun (voir history), et bitset
+        # des secrets encore possibles, réduit à la demande uniquement avec les essais qui ne sont
+        # pas encore appliqués. Sans table des indices, les secrets possibles sont recalculés en flux
+        self._moves: array | tuple = NO_MOVES
+        self._candidates = self.codebook.full_set if self.codebook.has_table else 0
+        self._narrowed = 0
+        # Mode adversaire : secrets encore possibles (tableau NumPy), None tant qu'aucun essai n'est joué.
+        # Le secret courant n'est qu'un de ces candidats, il peut changer à chaque essai
+        self._evil_candidates = None
+        self._secret = self._generate_combinaison() if secret is None else secret
+        Mastermind.log.info("New game: level %s, tries %s, evil %s, %s colors, %s pegs", self.level,
+                            self.max_tries, self.evil, self.codebook.colors, self.codebook.size)
+        if Mastermind.log.isEnabledFor(logging.DEBUG):
+            Mastermind.log.debug(f"Combination : {" ".join(color.name for color in self.secret_combination)}")
@@ -15,9 +15,13 @@ A chaque couleur présente mais mal positionnée, vous aurez en retour un indica
         'lose_window': "Dommage ! C'est perdu",
         'input_user': "Essai {try_number}/{max_tries} - Veuillez saisir vos {size_combination} chiffres pour les couleurs :",
         'clue': "Indicateurs :",
+        'remaining_combinations': "{count} combinaisons encore possibles",
         'choose_color': "Entrez votre combinaison secrète en utilisant les chiffres des couleurs disponibles.",
         'close': "Fermer",
         'help': "Aide",
+        'hint': "Indice",
+        'hint_searching': "Recherche d'un indice...",
+        'hint_result': "Essai conseillé :",
         'quit': "Quitter",
         'new_game': "Nouvelle partie",
         'submit': "Proposer",
@@ -32,9 +36,11 @@ A chaque couleur présente mais mal positionnée, vous aurez en retour un indica
         'tries': "essais",
         'nb_colors_availables': "Nombre de couleurs disponibles : ",
         'nb_max_tries': "Nombre de tentatives maximum : ",
+        'evil_mode': "Mode adversaire : le secret est choisi au fil des essais",
         'EASY': "facile",
         'NORMAL': "normal",
         'HARD': "difficile",
+        'PRACTICE': "entraînement",
         'YELLOW': "jaune",
         'BLUE': "bleu",
         'RED': "rouge",
@@ -58,9 +64,13 @@ For each color present but incorrectly positioned, you'll get a white indicator
         'lose_window': "Too bad! It's lost",
         'input_user': "Attempt {try_number}/{max_tries} - Please enter your {size_combination} digits for colors:",
         'clue': "Indicators:",
+        'remaining_combinations': "{count} combinations still possible",
         'choose_color': "Enter your secret combination using the numbers of the available colors.",
         'close': "Close",
         'help': "Help",
+        'hint': "Hint",
+        'hint_searching': "Searching for a hint...",
+        'hint_result': "Suggested guess:",
         'quit': "Quit",
         'new_game': "New game",
         'submit': "Submit",
@@ -75,9 +85,11 @@ For each color present but incorrectly positioned, you'll get a white indicator
         'tries': "tries",
         'nb_colors_availables': "Number of colors available: ",
         'nb_max_tries': "Maximum number of attempts: ",
+        'evil_mode': "Adversarial mode: the secret is chosen as you play",
         'EASY': "easy",
         'NORMAL': "normal",
         'HARD': "hard",
+        'PRACTICE': "practice",
         'YELLOW': "yellow",
         'BLUE': "blue",
         'RED': "red",
@@ -96,8 +108,8 @@ def get_translation(language: Language, key: str) -> str:
     """Retourne un texte dans la langue demandée"""
     return LANGUAGE[language][key]
 
-def get_help(mode: View, language: Language) -> str:
-    """Retourne le texte d'aide à afficher en fonction de la vue"""
+def get_help(mode: View, language: Language, size: int = SIZE_COMBINATION) -> str:
+    """Retourne le texte d'aide à afficher en fonction de la vue et du nombre de pions"""
     start_h1 = end_h1 = start_paragraph = end_paragraph = return_line = ""
     if mode == View.WINDOW:
         start_h1, end_h1 = "<h1>", "</h1>"
@@ -106,7 +118,7 @@ def get_help(mode: View, language: Language) -> str:
     preamble = get_translation(language, "preamble").format(
         start_h1=start_h1, end_h1=end_h1,
         start_paragraph=start_paragraph, end_paragraph=end_paragraph,
-        return_line=return_line, SIZE_COMBINATION=SIZE_COMBINATION
+        return_line=return_line, SIZE_COMBINATION=size
     )
     html_filename = f"help_{language.name}.html"
     return (f"{preamble}\n\n{get_translation(language, "choose_color")}\n"
@@ -0,0 +1,189 @@
+from functools import lru_cache
+from itertools import product
+from typing import Iterable, Iterator, Sequence
+
+import numpy as np
+
+from .code import Code, pack_feedback
+from .settings import SIZE_COMBINATION
+from mastermind.utils.parameters import Color
+
+# Nombre maximal de paires (essai, secret) traitées en une seule passe
+BLOCK_PAIRS = 1 << 22
+# Nombre maximal de codes d'un lot lors des parcours en flux de l'espace des combinaisons
+CHUNK_CODES = 1 << 17
+# Nombre d'essais dont les signatures des suffixes sont gardées en mémoire
+CACHED_GUESSES = 64
+
+# Index des couleurs de chaque pion d'une combinaison (voir code.CodeBook.digits_of)
+Digits = tuple[int, ...]
+
+
+def to_array(combinations: Iterable[tuple[Color, ...]], size: int = SIZE_COMBINATION) -> np.ndarray:
+    """Convertit des combinaisons de Color de size pions en un tableau d'index de couleurs"""
+    return np.array([[color.to_index() for color in combination] for combination in combinations],
+                    dtype=np.uint8).reshape(-1, size)
+
+
+def all_combinations(colors: int, size: int = SIZE_COMBINATION) -> np.ndarray:
+    """Retourne toutes les combinaisons possibles sous forme d'index de couleurs,
+    dans l'ordre lexicographique (premier pion le plus significatif)"""
+    return np.array(list(product(range(colors), repeat=size)), dtype=np.uint8).reshape(-1, size)
+
+
+def random_codes(count: int, colors: int, size: int = SIZE_COMBINATION,
+                 rng: np.random.Generator | None = None) -> np.ndarray:
+    """Tire count secrets uniformément, en un seul appel vectorisé, sous forme de codes compacts
+    (uint32, 4 octets par secret). Avec un générateur initialisé par une graine, le tirage est reproductible"""
+    rng = np.random.default_rng() if rng is None else rng
+    return rng.integers(colors ** size, size=count, dtype=np.uint32)
+
+
+def histograms(combinations: np.ndarray, colors: int) -> np.ndarray:
+    """Retourne, pour chaque combinaison, le nombre d'occurrences de chaque couleur"""
+    hist = np.zeros((len(combinations), colors), dtype=np.uint8)
+    for position in range(combinations.shape[1]):
+        np.add.at(hist, (np.arange(len(combinations)), combinations[:, position]), 1)
+    return hist
+
+
+def evaluate_batch(guesses: np.ndarray, secrets: np.ndarray,
+                   colors: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Évalue chaque essai contre chaque secret.
+    Retourne deux tableaux (essais x secrets) : le nombre d'indices rouges
+    et le nombre d'indices blancs, identiques à ceux de Mastermind.evaluate_combinaison"""
+    guesses = np.asarray(guesses, dtype=np.uint8)
+    secrets = np.asarray(secrets, dtype=np.uint8)
+    if colors is None:
+        colors = int(max(guesses.max(initial=0), secrets.max(initial=0))) + 1
+    hist_guesses = histograms(guesses, colors)
+    hist_secrets = histograms(secrets, colors)
+    red = np.empty((len(guesses), len(secrets)), dtype=np.uint8)
+    white = np.empty_like(red)
+    step = max(1, BLOCK_PAIRS // max(1, len(secrets)))
+    for start in range(0, len(guesses), step):
+        stop = min(start + step, len(guesses))
+        _evaluate_block(guesses[start:stop], secrets, hist_guesses[start:stop], hist_secrets,
+                        red[start:stop], white[start:stop])
+    return red, white
+
+
+def _evaluate_block(guesses: np.ndarray, secrets: np.ndarray,
+                    hist_guesses: np.ndarray, hist_secrets: np.ndarray,
+                    red: np.ndarray, white: np.ndarray) -> None:
+    """Remplit red et white pour un bloc d'essais"""
+    buffer = np.empty_like(red)
+    red.fill(0)
+    for position in range(guesses.shape[1]):
+        np.equal(guesses[:, None, position], secrets[None, :, position], out=buffer, casting='unsafe')
+        red += buffer
+    white.fill(0)
+    for color in range(hist_guesses.shape[1]):
+        np.minimum(hist_guesses[:, None, color], hist_secrets[None, :, color], out=buffer)
+        white += buffer
+    white -= red
+
+
+class CombinationStream:
+    """Parcours en flux, par lots de taille bornée, des combinaisons compatibles avec un historique.
+    Les codes d'un lot partagent leurs premiers pions (préfixe) et parcourent toutes les valeurs
+    des pions suivants (suffixe). Face à un essai, les suffixes sont regroupés une fois pour toutes
+    par signature (rouges, occurrences des couleurs de l'essai) : pour chaque lot, les indices
+    ne sont calculés que par signature puis distribués aux codes en une seule lecture.
+    La mémoire utilisée dépend de CHUNK_CODES et non du nombre de combinaisons"""
+    def __init__(self, colors: int, size: int = SIZE_COMBINATION, chunk: int = CHUNK_CODES) -> None:
+        self.colors = colors
+        self.size = size
+        self.count = colors ** size
+        self.classes_number = pack_feedback(size, 0) + 1
+        suffix_size = 1
+        while suffix_size < size and colors ** (suffix_size + 1) <= chunk:
+            suffix_size += 1
+        self.suffix_size = suffix_size
+        self.suffix_count = colors ** suffix_size
+        self._suffixes = all_combinations(colors, suffix_size)
+        self._signatures: dict[Digits, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def _suffix_signatures(self, guess: Digits) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Retourne la signature de chaque suffixe face à l'essai, puis pour chaque signature
+        le nombre de pions bien placés et les occurrences des couleurs de l'essai.
+        Les occurrences sont plafonnées à celles de l'essai, ce qui ne change pas les indices"""
+        if (signatures := self._signatures.get(guess)) is None:
+            if len(self._signatures) >= CACHED_GUESSES:
+                self._signatures.clear()
+            # Chaque colonne (rouges puis une par couleur de l'essai) est un chiffre en base size + 1
+            base = self.size + 1
+            columns = [(self._suffixes == np.array(guess[-self.suffix_size:], dtype=np.uint8)).sum(axis=1)]
+            columns += [np.minimum((self._suffixes == color).sum(axis=1), guess.count(color))
+                        for color in sorted(set(guess))]
+            keys = np.zeros(self.suffix_count, dtype=np.int64)
+            for column in columns:
+                keys = keys * base + column
+            unique, inverse = np.unique(keys, return_inverse=True)
+            digits = unique[:, None] // base ** np.arange(len(columns) - 1, -1, -1) % base
+            digits = digits.astype(np.uint8)
+            signatures = self._signatures[guess] = inverse.reshape(-1), digits[:, 0], digits[:, 1:]
+        return signatures
+
+    def _signature_feedback(self, guess: Digits, head: Digits) -> tuple[np.ndarray, np.ndarray]:
+        """Retourne la signature de chaque suffixe et l'octet d'indices de chaque signature
+        pour les codes du lot de préfixe head"""
+        inverse, red, counts = self._suffix_signatures(guess)
+        colors = sorted(set(guess))
+        head_counts = np.array([head.count(color) for color in colors], dtype=np.uint8)
+        guess_counts = np.array([guess.count(color) for color in colors], dtype=np.uint8)
+        red = red + sum(map(int.__eq__, guess, head))
+        common = np.minimum(counts + head_counts, guess_counts).sum(axis=1, dtype=np.uint8)
+        return inverse, red << 4 | (common - red)
+
+    def _feedback(self, guess: Digits, head: Digits, index: np.ndarray | slice) -> np.ndarray:
+        """Retourne les octets d'indices de l'essai face aux codes du lot de préfixe head
+        dont les suffixes sont désignés par index"""
+        inverse, feedback = self._signature_feedback(guess, head)
+        return feedback.take(inverse[index])
+
+    def _chunks(self, history: Sequence[tuple[Digits, int]]) -> Iterator[tuple[Digits, int, np.ndarray | slice]]:
+        """Parcourt les lots et retourne pour chacun (préfixe, numéro du lot, index des suffixes
+        compatibles avec l'historique). Les lots sans aucun code compatible sont omis"""
+        for prefix, head in enumerate(product(range(self.colors), repeat=self.size - self.suffix_size)):
+            index = slice(None)
+            for guess, feedback in history:
+                inverse, signature_feedback = self._signature_feedback(guess, head)
+                keep = (signature_feedback == feedback).take(inverse[index])
+                index = np.flatnonzero(keep) if isinstance(index, slice) else index[keep]
+                if not len(index):
+                    break
+            else:
+                yield head, prefix, index
+
+    def consistent(self, history: Sequence[tuple[Digits, int]]) -> Iterator[np.ndarray]:
+        """Parcourt, lot par lot, les codes compatibles avec l'historique (essais sous forme de chiffres)"""
+        suffixes = np.arange(self.suffix_count, dtype=np.int64)
+        for _, prefix, index in self._chunks(history):
+            yield prefix * self.suffix_count + suffixes[index]
+
+    def count_consistent(self, history: Sequence[tuple[Digits, int]]) -> int:
+        """Retourne le nombre de codes compatibles avec l'historique"""
+        return sum(len(codes) for codes in self.consistent(history))
+
+    def partition(self, guess: Digits, history: Sequence[tuple[Digits, int]]) -> np.ndarray:
+        """Retourne la taille de chaque classe d'indices (indexée par l'octet d'indices)
+        de l'essai parmi les codes compatibles avec l'historique"""
+        sizes = np.zeros(self.classes_number, dtype=np.int64)
+        for head, _, index in self._chunks(history):
+            sizes += np.bincount(self._feedback(guess, head, index), minlength=self.classes_number)
+        return sizes
+
+    def nth(self, history: Sequence[tuple[Digits, int]], number: int) -> Code:
+        """Retourne le code compatible avec l'historique de rang donné"""
+        for codes in self.consistent(history):
+            if number < len(codes):
+                return int(codes[number])
+            number -= len(codes)
+        raise IndexError("Not enough codes consistent with the history")
+
+
+@lru_cache
+def get_stream(colors: int, size: int = SIZE_COMBINATION) -> CombinationStream:
+    """Retourne le parcours en flux partagé pour un nombre de couleurs et de pions donné"""
+    return CombinationStream(colors, size)
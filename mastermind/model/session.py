@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from random import Random
+from secrets import randbits
+from time import monotonic
+
+from .game import SHARED_RNG, Mastermind
+from .settings import IDLE_TIMEOUT, MAX_SESSIONS
+from mastermind.utils.logger import setup_logger
+from mastermind.utils.parameters import Level, Try
+
+
+class Session(Mastermind):
+    """Partie hébergée, qui retient sa dernière utilisation pour l'expiration"""
+    __slots__ = ('last_use',)
+
+
+class SessionStore:
+    """Parties en cours, indexées par identifiant de session. Elles sont rangées
+    de la moins à la plus récemment utilisée : l'expiration et l'éviction ne parcourent
+    que les plus anciennes, sans jamais trier.
+    Les identifiants sont des entiers de 64 bits, présentés aux clients en hexadécimal.
+    Toutes les parties partagent le générateur rng, les identifiants restant tirés par le module secrets"""
+    log = setup_logger("session")
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS, idle_timeout: float = IDLE_TIMEOUT,
+                 rng: Random = SHARED_RNG) -> None:
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.rng = rng
+        self._sessions: OrderedDict[int, Session] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self, level: Level, tries: Try, evil: bool = False) -> tuple[str, Mastermind]:
+        """Démarre une partie et retourne son identifiant de session.
+        Au-delà de max_sessions, la partie la moins récemment utilisée est retirée"""
+        key = randbits(64)
+        while key in self._sessions:
+            key = randbits(64)
+        game = self._sessions[key] = Session(level, tries, evil, rng=self.rng)
+        game.last_use = monotonic()
+        while len(self._sessions) > self.max_sessions:
+            evicted, _ = self._sessions.popitem(last=False)
+            SessionStore.log.debug("Session evicted: %016x", evicted)
+        return f"{key:016x}", game
+
+    def get(self, session_id: str) -> Mastermind | None:
+        """Retourne la partie de la session et la marque comme utilisée, None si elle n'existe plus"""
+        try:
+            key = int(session_id, 16)
+        except (TypeError, ValueError):
+            return None
+        if (game := self._sessions.get(key)) is None:
+            return None
+        game.last_use = monotonic()
+        self._sessions.move_to_end(key)
+        return game
+
+    def remove(self, session_id: str) -> None:
+        try:
+            self._sessions.pop(int(session_id, 16), None)
+        except (TypeError, ValueError):
+            pass
+
+    def expire(self, now: float | None = None) -> int:
+        """Retire les parties inactives depuis plus de idle_timeout et retourne leur nombre"""
+        limit = (monotonic() if now is None else now) - self.idle_timeout
+        expired = 0
+        while self._sessions:
+            key, game = next(iter(self._sessions.items()))
+            if game.last_use > limit:
+                break
+            del self._sessions[key]
+            expired += 1
+        if expired:
+            SessionStore.log.info("%s idle sessions expired, %s left", expired, len(self._sessions))
+        return expired
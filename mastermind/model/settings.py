@@ -1,39 +1,99 @@
-from json import JSONDecodeError, load, dump
-
-from jsonschema import validate, ValidationError
+import atexit
+import os
+from functools import cache
+from json import JSONDecodeError, load, dumps
+from threading import Lock, Timer
 
 from mastermind.utils.dir import Dir
 from mastermind.utils.logger import setup_logger
-from mastermind.utils.parameters import Level, Try, Language
+from mastermind.utils.parameters import Color, Level, Try, Language
 
 SIZE_COMBINATION = 4
+# Nombres de pions et de couleurs possibles en mode console
+SIZES_COMBINATION = range(4, 9)
+COLORS_NUMBERS = range(2, len(Color) + 1)
 SQUARE = "\u25A0"  # correspondant à ■
 DOT = "\u25CF"  # correspondant à ●
 RESET_COLOR = "\033[0m"
+# Nombre maximal de parties gardées en mémoire par le serveur, les moins récemment utilisées sont retirées en premier
+MAX_SESSIONS = 100_000
+# Délai, en secondes, après lequel une partie inactive est retirée du serveur
+IDLE_TIMEOUT = 600.0
+# Délai, en secondes, pendant lequel les modifications du paramétrage sont regroupées avant écriture
+SAVE_DELAY = 0.5
+
+CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "language": {"enum": Language.to_list()},
+        "level": {"enum": Level.to_list()},
+        "tries": {"enum": Try.to_list()},
+    },
+    "required": ["language", "level", "tries"]
+}
+
+
+@cache
+def get_validator():
+    """Retourne le validateur du schéma, compilé une seule fois.
+    jsonschema n'est chargé qu'au premier fichier invalide"""
+    from jsonschema.validators import validator_for
+    validator_class = validator_for(CONFIG_SCHEMA)
+    validator_class.check_schema(CONFIG_SCHEMA)
+    return validator_class(CONFIG_SCHEMA)
 
 
 class Config:
-    """Gestion via un fichier json de paramètres"""
+    """Gestion via un fichier json de paramètres. Les modifications sont regroupées
+    et écrites en différé, de façon atomique, uniquement si le contenu a changé"""
     _DEFAULT_CONFIG = {'language': 'FR', 'level': 'normal', 'tries': 'normal'}
     log = setup_logger("config")
 
     def __init__(self):
-        self._schema = {
-            "type": "object",
-            "properties": {
-                "language": {"enum": Language.to_list()},
-                "level": {"enum": Level.to_list()},
-                "tries": {"enum": Try.to_list()},
-            },
-            "required": ["language", "level", "tries"]
-        }
+        self.path = Dir.ROOT / "config.json"
+        self._lock = Lock()
+        self._timer: Timer | None = None
+        self._saved: dict = {}
         self._config = self._get_config()
 
-    @staticmethod
-    def _set_config(config: dict) -> None:
-        """Stockage du paramètrage en json"""
-        with open(Dir.ROOT / "config.json", 'w', encoding='utf-8') as file:
-            dump(config, file, indent=4)
+    def _set_config(self, key: str, value: str) -> None:
+        """Modifie une valeur du paramètrage et programme son stockage"""
+        if self._config.get(key) == value:
+            return
+        self._config[key] = value
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Programme l'écriture différée : les modifications rapprochées n'en déclenchent qu'une.
+        Une écriture en attente est faite au plus tard à la fin du programme"""
+        with self._lock:
+            if self._timer is None:
+                atexit.register(self.flush)
+            else:
+                self._timer.cancel()
+            self._timer = Timer(SAVE_DELAY, self._delayed_flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _delayed_flush(self) -> None:
+        atexit.unregister(self.flush)
+        self.flush()
+
+    def flush(self) -> None:
+        """Stockage du paramètrage en json, si différent du contenu du fichier.
+        Le fichier est écrit à côté puis renommé pour ne jamais être lu à moitié écrit"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._config == self._saved:
+                return
+            config = dict(self._config)
+            temporary = self.path.with_suffix(".tmp")
+            with open(temporary, 'w', encoding='utf-8') as file:
+                file.write(dumps(config, indent=4))
+            os.replace(temporary, self.path)
+            self._saved = config
 
     @property
     def language(self) -> Language:
@@ -43,8 +103,7 @@ class Config:
     def language(self, value: Language) -> None:
         if not isinstance(value, Language):
             raise ValueError("")
-        self._config["language"] = value.name
-        self._set_config(self._config)
+        self._set_config("language", value.name)
 
     @property
     def level(self) -> Level:
@@ -54,8 +113,7 @@ class Config:
     def level(self, value: Level) -> None:
         if not isinstance(value, Level):
             raise ValueError("")
-        self._config["level"] = value.name.lower()
-        self._set_config(self._config)
+        self._set_config("level", value.name.lower())
 
     @property
     def tries(self) -> Try:
@@ -65,13 +123,24 @@ class Config:
     def tries(self, value: Try) -> None:
         if not isinstance(value, Try):
             raise ValueError("")
-        self._config["tries"] = value.name.lower()
-        self._set_config(self._config)
+        self._set_config("tries", value.name.lower())
 
-    def _check_json(self, data) -> bool:
-        """Validation des données"""
+    @staticmethod
+    def _is_known_config(data) -> bool:
+        """Vérification rapide : chaque clé requise a l'une des valeurs autorisées"""
+        return isinstance(data, dict) and all(
+            data.get(key) in CONFIG_SCHEMA["properties"][key]["enum"] for key in CONFIG_SCHEMA["required"]
+        )
+
+    @staticmethod
+    def _check_json(data) -> bool:
+        """Validation des données. Le validateur n'est utilisé que si la vérification
+        rapide échoue, pour expliquer l'erreur"""
+        if Config._is_known_config(data):
+            return True
+        from jsonschema import ValidationError
         try:
-            validate(instance=data, schema=self._schema)
+            get_validator().validate(data)
         except ValidationError as e:
             print(f"Erreur de validation: {e}")
             return False
@@ -79,9 +148,9 @@ class Config:
 
     def _get_config(self) -> dict:
         """Si valide, retourne le paramètrage stocké dans le fichier config.json.
-        Sinon le paramètrage par défaut"""
+        Sinon le paramètrage par défaut, dont l'écriture est différée"""
         try:
-            with open(Dir.ROOT / "config.json", 'r', encoding='utf-8') as file:
+            with open(self.path, 'r', encoding='utf-8') as file:
                 config: dict = load(file)
         except JSONDecodeError as e:
             Config.log.error(f"JSON decoding error: {e}")
@@ -91,7 +160,8 @@ class Config:
             Config.log.error(f"An error has occurred: {e}")
         else:
             if self._check_json(config):
+                self._saved = dict(config)
                 return config
-        self._set_config(Config._DEFAULT_CONFIG)
+        self._schedule_save()
         Config.log.info("Restored configuration file")
-        return Config._DEFAULT_CONFIG
+        return dict(Config._DEFAULT_CONFIG)
@@ -0,0 +1,186 @@
+"""Livre d'ouvertures : arbre de décision précalculé d'une stratégie déterministe,
+de l'historique des indices vers le prochain essai.
+
+python -m mastermind.solver.book [build|verify] [-s knuth] [-l easy normal hard]
+"""
+import os
+from argparse import ArgumentParser
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from struct import Struct
+from time import perf_counter
+from zlib import crc32
+
+import numpy as np
+
+from mastermind.model.code import Code, pack_feedback
+from mastermind.model.settings import SIZE_COMBINATION
+from mastermind.utils.dir import Dir
+from mastermind.utils.logger import setup_logger
+from mastermind.utils.parameters import Level, Solver
+
+# Incrémentée quand les décisions d'une stratégie changent, les livres existants devenant périmés
+VERSION = 2
+MAGIC = b"MMOB"
+# magic, version, nombre de couleurs, taille des combinaisons, nombre de noeuds, checksum
+HEADER = Struct("<4sHBBII")
+# Stratégies déterministes, les seules dont les décisions peuvent être précalculées
+BOOK_SOLVERS = (Solver.KNUTH, Solver.ENTROPY)
+
+
+def book_path(solver: Solver, colors: int, size: int = SIZE_COMBINATION) -> Path:
+    return Dir.CACHE / f"book_{solver}_{colors}x{size}.bin"
+
+
+class OpeningBook:
+    """Arbre de décision projeté en mémoire. Les noeuds sont numérotés en largeur d'abord :
+    chaque noeud, sauf la racine, est l'enfant d'exactement une arête et les arêtes sont
+    numérotées dans le même ordre, l'arête i mène donc au noeud i + 1.
+    Le fichier contient, après l'en-tête : l'index de la première arête de chaque noeud
+    (uint32, un de plus que de noeuds), l'essai de chaque noeud (uint16)
+    et l'octet d'indices de chaque arête (uint8), croissant pour un même noeud"""
+    log = setup_logger("book")
+
+    def __init__(self, path: Path, colors: int, size: int, nodes: int) -> None:
+        self.colors = colors
+        self.size = size
+        self.nodes = nodes
+        data = np.memmap(path, dtype=np.uint8, mode='r')
+        start = HEADER.size
+        self.first_edges = data[start:start + 4 * (nodes + 1)].view('<u4')
+        start += 4 * (nodes + 1)
+        self.guesses = data[start:start + 2 * nodes].view('<u2')
+        self.feedbacks = data[start + 2 * nodes:]
+
+    @classmethod
+    def open(cls, solver: Solver, colors: int, size: int = SIZE_COMBINATION) -> 'OpeningBook | None':
+        """Retourne le livre s'il existe et qu'il est intègre, None sinon"""
+        path = book_path(solver, colors, size)
+        try:
+            with open(path, 'rb') as file:
+                header = file.read(HEADER.size)
+                data = file.read()
+        except FileNotFoundError:
+            return None
+        if len(header) != HEADER.size:
+            cls.log.warning(f"Truncated opening book: {path}")
+            return None
+        magic, version, book_colors, book_size, nodes, checksum = HEADER.unpack(header)
+        if ((magic, version, book_colors, book_size) != (MAGIC, VERSION, colors, size)
+                or len(data) != 7 * nodes + 3 or crc32(data) != checksum):
+            cls.log.warning(f"Stale opening book: {path}")
+            return None
+        return cls(path, colors, size, nodes)
+
+    def child(self, node: int, feedback: int) -> int | None:
+        """Retourne le noeud atteint depuis node avec ces indices, None s'il n'existe pas"""
+        start, stop = int(self.first_edges[node]), int(self.first_edges[node + 1])
+        edge = start + int(self.feedbacks[start:stop].searchsorted(feedback))
+        return edge + 1 if edge < stop and self.feedbacks[edge] == feedback else None
+
+    def lookup(self, history: list[tuple[Code, int]]) -> Code | None:
+        """Retourne l'essai du livre après cet historique, en O(profondeur).
+        None si l'historique s'écarte des essais du livre"""
+        node = 0
+        for guess, feedback in history:
+            if self.guesses[node] != guess or (node := self.child(node, feedback)) is None:
+                return None
+        return int(self.guesses[node])
+
+
+@lru_cache
+def get_opening_book(solver: Solver, colors: int, size: int = SIZE_COMBINATION) -> OpeningBook | None:
+    """Retourne le livre partagé, ouvert au premier appel. None s'il n'a pas été construit"""
+    return OpeningBook.open(solver, colors, size)
+
+
+def _new_strategy(solver: Solver, colors: int, size: int):
+    """Retourne une stratégie qui calcule chaque essai sans consulter de livre"""
+    from mastermind.solver.entropy import EntropySolver
+    from mastermind.solver.knuth import KnuthSolver
+    strategy = KnuthSolver(colors, size) if solver == Solver.KNUTH else EntropySolver(colors, size)
+    strategy.use_book = False
+    return strategy
+
+
+def build_book(solver: Solver, colors: int, size: int = SIZE_COMBINATION) -> Path:
+    """Calcule l'arbre de décision complet de la stratégie, en largeur d'abord,
+    et l'écrit de façon atomique"""
+    from mastermind.model.feedback_table import get_feedback_table
+    table = get_feedback_table(colors, size).table
+    win = pack_feedback(size, 0)
+    strategy = _new_strategy(solver, colors, size)
+    first_edges, guesses, feedbacks = [0], [], []
+    pending: deque[list[tuple[Code, int]]] = deque([[]])
+    try:
+        while pending:
+            history = pending.popleft()
+            strategy.reset()
+            for guess, feedback in history:
+                strategy.observe(guess, feedback)
+            guess = strategy.next_code()
+            guesses.append(guess)
+            for feedback in np.unique(table[guess, strategy.candidates]).tolist():
+                if feedback != win:
+                    feedbacks.append(feedback)
+                    pending.append(history + [(guess, feedback)])
+            first_edges.append(len(feedbacks))
+    finally:
+        if hasattr(strategy, 'close'):
+            strategy.close()
+    data = (np.array(first_edges, dtype='<u4').tobytes() + np.array(guesses, dtype='<u2').tobytes()
+            + np.array(feedbacks, dtype=np.uint8).tobytes())
+    path = book_path(solver, colors, size)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = Path(f"{path}.{os.getpid()}.tmp")
+    with open(temp_path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, colors, size, len(guesses), crc32(data)))
+        file.write(data)
+    os.replace(temp_path, path)
+    get_opening_book.cache_clear()
+    return path
+
+
+def verify_book(book: OpeningBook) -> tuple[int, float]:
+    """Rejoue chaque secret possible avec le livre. Retourne le nombre d'essais
+    dans le pire cas et en moyenne. Lève ValueError si un secret n'est pas trouvé"""
+    from mastermind.model.feedback_table import get_feedback_table
+    table = get_feedback_table(book.colors, book.size).table
+    win = pack_feedback(book.size, 0)
+    counts = []
+    for secret in range(book.colors ** book.size):
+        node, tries = 0, 1
+        while (feedback := int(table[book.guesses[node], secret])) != win:
+            if (node := book.child(node, feedback)) is None:
+                raise ValueError(f"Secret {secret} leaves the book after {tries} guesses")
+            tries += 1
+        counts.append(tries)
+    return max(counts), sum(counts) / len(counts)
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Mastermind UYS opening book",
+                            description="Construction et vérification des livres d'ouvertures")
+    parser.add_argument('command', choices=('build', 'verify'), nargs='?', default='build')
+    parser.add_argument('-s', '--strategy', choices=[str(solver) for solver in BOOK_SOLVERS],
+                        default=Solver.KNUTH.value, help="Stratégie déterministe")
+    parser.add_argument('-l', '--levels', nargs='+', choices=Level.to_list(), default=Level.to_list(),
+                        help="Niveaux traités")
+    args = parser.parse_args()
+    solver = Solver.from_string(args.strategy)
+    for level in map(Level.from_string, args.levels):
+        if args.command == 'build':
+            start = perf_counter()
+            path = build_book(solver, level.value)
+            print(f"{level}: {get_opening_book(solver, level.value).nodes} nodes, "
+                  f"{path.stat().st_size} bytes, built in {perf_counter() - start:.1f}s")
+        elif (book := get_opening_book(solver, level.value)) is None:
+            print(f"{level}: no opening book, run the build command first")
+        else:
+            worst, average = verify_book(book)
+            print(f"{level}: worst case {worst} guesses, average {average:.4f} guesses")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,22 @@
+from random import Random
+from typing import Self
+
+from mastermind.model.code import Code
+from mastermind.model.game import Mastermind
+from mastermind.model.settings import SIZE_COMBINATION
+from mastermind.solver.strategy import Strategy
+
+
+class ConsistentSolver(Strategy):
+    """Stratégie naïve : joue au hasard l'un des secrets encore possibles.
+    Le tirage utilise rng, le générateur de la partie jouée avec from_game"""
+    def __init__(self, colors: int, size: int = SIZE_COMBINATION, rng: Random | None = None) -> None:
+        self.rng = Random() if rng is None else rng
+        super().__init__(colors, size)
+
+    @classmethod
+    def from_game(cls, game: Mastermind) -> Self:
+        return cls(game.codebook.colors, game.codebook.size, game.rng)
+
+    def _choose_code(self) -> Code:
+        return int(self.candidates[self.rng.randrange(len(self.candidates))])
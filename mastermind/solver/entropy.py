@@ -0,0 +1,129 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from time import perf_counter
+from typing import Self
+
+import numpy as np
+
+from mastermind.model.code import Code, pack_feedback
+from mastermind.model.feedback_table import get_feedback_table
+from mastermind.model.settings import SIZE_COMBINATION
+from mastermind.solver.strategy import Strategy, partition_sizes
+from mastermind.utils.logger import setup_logger
+from mastermind.utils.parameters import Solver
+
+# En dessous de ce nombre de cases (essai, secret), le calcul reste dans le processus courant
+PARALLEL_THRESHOLD = 1 << 18
+# Nombre de fragments de l'espace des essais par processus, pour équilibrer la charge
+SHARDS_PER_WORKER = 4
+# Nombre maximal de cases (essai, secret) lues dans la table en une passe
+BLOCK_CELLS = 1 << 22
+
+
+def _best_in_shard(colors: int, size: int, candidates: np.ndarray,
+                   start: int, stop: int) -> tuple[tuple[float, bool, Code], int, bool]:
+    """Évalue les essais de start à stop. Retourne le meilleur triplet
+    (entropie, est candidat, code), le nombre d'essais évalués
+    et si un candidat à répartition parfaite (un secret par classe) a été trouvé.
+    Aucun essai de code supérieur ne pouvant battre ce candidat, la recherche s'y arrête"""
+    table = get_feedback_table(colors, size).table
+    classes_number = pack_feedback(size, 0) + 1
+    is_candidate = np.zeros(stop - start, dtype=bool)
+    is_candidate[candidates[(candidates >= start) & (candidates < stop)] - start] = True
+    log_n = np.log2(len(candidates))
+    best = (-1.0, False, -1)
+    step = max(1, BLOCK_CELLS // len(candidates))
+    for block in range(start, stop, step):
+        counts = partition_sizes(table, slice(block, min(block + step, stop)), candidates, classes_number)
+        weighted = counts * np.log2(counts, where=counts > 0, out=np.zeros(counts.shape))
+        entropies = log_n - weighted.sum(axis=1) / len(candidates)
+        in_block = is_candidate[block - start:block - start + len(counts)]
+        # Meilleure entropie, puis préférence pour les candidats, puis le plus petit code
+        index = int(np.lexsort((-np.arange(len(counts)), in_block, entropies))[-1])
+        challenger = (float(entropies[index]), bool(in_block[index]), block + index)
+        if _is_better(challenger, best):
+            best = challenger
+        if in_block[index] and counts[index].max() == 1:
+            return best, block + len(counts) - start, True
+    return best, stop - start, False
+
+
+def _is_better(challenger: tuple[float, bool, int], best: tuple[float, bool, int]) -> bool:
+    """Compare deux triplets (entropie, est candidat, code)"""
+    return (challenger[0], challenger[1], -challenger[2]) > (best[0], best[1], -best[2])
+
+
+class EntropySolver(Strategy):
+    """Stratégie qui joue l'essai maximisant l'information attendue (entropie de la
+    répartition des secrets possibles). L'espace des essais est découpé en fragments
+    évalués en parallèle par un pool de processus"""
+    log = setup_logger("solver")
+    deterministic = True
+    solver = Solver.ENTROPY
+
+    def __init__(self, colors: int, size: int = SIZE_COMBINATION, workers: int | None = None) -> None:
+        super().__init__(colors, size)
+        self.workers = workers or os.cpu_count() or 1
+        self.throughput = 0.0
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Arrête le pool de processus"""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Crée le pool au premier besoin, chaque processus projetant la table une seule fois"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 initializer=get_feedback_table,
+                                                 initargs=(self.codebook.colors, self.codebook.size))
+        return self._executor
+
+    def _choose_code(self) -> Code:
+        """Évalue tous les essais et retourne le meilleur"""
+        start_time = perf_counter()
+        count, colors, size = self.codebook.count, self.codebook.colors, self.codebook.size
+        if self.workers == 1 or count * len(self.candidates) < PARALLEL_THRESHOLD:
+            (entropy, _, code), evaluated, _ = _best_in_shard(colors, size, self.candidates, 0, count)
+        else:
+            (entropy, _, code), evaluated = self._search_parallel()
+        elapsed = perf_counter() - start_time
+        self.throughput = evaluated / elapsed if elapsed else float('inf')
+        EntropySolver.log.debug(f"{evaluated} guesses in {elapsed:.3f}s ({self.throughput:.0f} guesses/s), "
+                                f"entropy {entropy:.3f}")
+        return code
+
+    def _search_parallel(self) -> tuple[tuple[float, bool, Code], int]:
+        """Répartit les essais entre les processus et fusionne les meilleurs résultats.
+        Un candidat à répartition parfaite n'abandonne que les fragments de codes supérieurs :
+        les fragments inférieurs sont toujours fusionnés, le résultat est donc celui
+        de la recherche dans le processus courant, quel que soit l'ordre de fin des fragments"""
+        count = self.codebook.count
+        shards = min(count, self.workers * SHARDS_PER_WORKER)
+        bounds = [count * i // shards for i in range(shards + 1)]
+        executor = self._get_executor()
+        starts = {executor.submit(_best_in_shard, self.codebook.colors, self.codebook.size,
+                                  self.candidates, start, stop): start
+                  for start, stop in zip(bounds, bounds[1:])}
+        best, evaluated = (-1.0, False, -1), 0
+        pending = set(starts)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                challenger, shard_evaluated, perfect = future.result()
+                evaluated += shard_evaluated
+                if _is_better(challenger, best):
+                    best = challenger
+                if perfect:
+                    for skipped in [other for other in pending if starts[other] > challenger[2]]:
+                        skipped.cancel()
+                        pending.discard(skipped)
+        return best, evaluated
@@ -0,0 +1,42 @@
+import numpy as np
+
+from mastermind.model.code import Code
+from mastermind.solver.strategy import Strategy
+from mastermind.utils.parameters import Solver
+
+# Nombre maximal de cases (essai, secret) lues dans la table en une passe
+BLOCK_CELLS = 1 << 22
+
+
+class KnuthSolver(Strategy):
+    """Stratégie minimax de Knuth : joue l'essai qui minimise, dans le pire cas,
+    le nombre de secrets encore possibles. Parmi les ex æquo, un essai qui peut
+    être le secret est préféré, puis le plus petit code"""
+    deterministic = True
+    solver = Solver.KNUTH
+    block_cells = BLOCK_CELLS
+
+    def opening(self) -> Code:
+        """Premier essai de type 'AABB' (1122 chez Knuth)"""
+        code = 0
+        for position in range(self.codebook.size):
+            code = code * self.codebook.colors + min(position // 2, self.codebook.colors - 1)
+        return code
+
+    def _choose_code(self) -> Code:
+        if not self.history:
+            return self.opening()
+        is_candidate = np.zeros(self.codebook.count, dtype=np.intp)
+        is_candidate[self.candidates] = 1
+        best_score, best_code = None, None
+        step = max(1, self.block_cells // len(self.candidates))
+        for start in range(0, self.codebook.count, step):
+            self.check_cancelled()
+            guesses = slice(start, min(start + step, self.codebook.count))
+            worst = self.partition_sizes(guesses).max(axis=1)
+            # Critère double : pire cas d'abord, puis préférence pour les candidats
+            scores = worst * 2 - is_candidate[guesses]
+            index = int(scores.argmin())
+            if best_score is None or scores[index] < best_score:
+                best_score, best_code = scores[index], start + index
+        return best_code
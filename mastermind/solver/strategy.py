@@ -0,0 +1,125 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Event, Lock
+from typing import Self
+
+import numpy as np
+
+from mastermind.model.code import Code, get_codebook, pack_feedback
+from mastermind.model.feedback_table import get_feedback_table
+from mastermind.model.game import Mastermind
+from mastermind.model.settings import SIZE_COMBINATION
+from mastermind.utils.parameters import Color, Solver
+
+# Nombre maximal de décisions mémorisées, les moins récemment utilisées sont oubliées en premier
+MAX_DECISIONS = 1 << 15
+
+
+def partition_sizes(table: np.ndarray, guesses: np.ndarray | slice,
+                    candidates: np.ndarray, classes_number: int) -> np.ndarray:
+    """Retourne, pour chaque essai donné, la taille de chaque classe d'indices
+    parmi les secrets candidats (tableau essais x classes)"""
+    classes = table[guesses].take(candidates, axis=1).astype(np.intp)
+    classes += np.arange(len(classes))[:, None] * classes_number
+    return np.bincount(classes.ravel(), minlength=len(classes) * classes_number
+                       ).reshape(len(classes), classes_number)
+
+
+class SearchCancelled(Exception):
+    """Levée lorsqu'une recherche est annulée avant son terme"""
+
+
+class Strategy(ABC):
+    """Base des stratégies de résolution. Suit l'historique des essais
+    et réduit la liste des secrets encore possibles après chaque indice"""
+    # Une stratégie déterministe joue toujours le même essai pour un même historique :
+    # ses décisions sont alors mémorisées et partagées entre les parties, dans la limite de MAX_DECISIONS.
+    # Le verrou protège le cache des threads de calcul des indices (mode fenêtré)
+    deterministic = False
+    _decisions: OrderedDict[tuple, Code] = OrderedDict()
+    _decisions_lock = Lock()
+    # Stratégie dont le livre d'ouvertures est consulté avant toute recherche (voir solver.book)
+    solver: Solver | None = None
+
+    def __init__(self, colors: int, size: int = SIZE_COMBINATION) -> None:
+        self.codebook = get_codebook(colors, size)
+        self.table = get_feedback_table(colors, size).table
+        # Les octets d'indices servent directement de classes, le plus grand étant la victoire
+        self.classes_number = pack_feedback(size, 0) + 1
+        self._all_codes = np.arange(self.codebook.count, dtype=np.intp)
+        # Positionné, l'événement interrompt la recherche entre deux blocs
+        self.cancel_event: Event | None = None
+        self.use_book = self.solver is not None
+        self.reset()
+
+    @classmethod
+    def from_game(cls, game: Mastermind) -> Self:
+        """Retourne une stratégie adaptée à la partie donnée"""
+        return cls(game.codebook.colors, game.codebook.size)
+
+    @property
+    def remaining(self) -> int:
+        """Nombre de secrets encore compatibles avec l'historique"""
+        return len(self.candidates)
+
+    def reset(self) -> None:
+        """Réinitialise la stratégie pour une nouvelle partie"""
+        self.candidates = self._all_codes
+        self.history: list[tuple[Code, int]] = []
+
+    def observe(self, guess: Code, feedback: int) -> None:
+        """Enregistre un essai et son octet d'indices, puis ne conserve
+        que les secrets qui auraient produit ces indices"""
+        self.history.append((guess, feedback))
+        self.candidates = self.candidates[self.table[guess, self.candidates] == feedback]
+
+    def update(self, combination: tuple[Color, ...], clues: tuple[Color, ...]) -> None:
+        """Consomme le résultat de Mastermind.evaluate_combinaison"""
+        self.observe(self.codebook.encode(combination),
+                     pack_feedback(clues.count(Color.RED), clues.count(Color.WHITE)))
+
+    def check_cancelled(self) -> None:
+        """Lève SearchCancelled si l'annulation de la recherche a été demandée"""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise SearchCancelled
+
+    def _book_code(self) -> Code | None:
+        """Retourne l'essai du livre d'ouvertures, None sans livre ou hors du livre"""
+        if not self.use_book:
+            return None
+        from mastermind.solver.book import get_opening_book
+        book = get_opening_book(self.solver, self.codebook.colors, self.codebook.size)
+        return None if book is None else book.lookup(self.history)
+
+    @abstractmethod
+    def _choose_code(self) -> Code:
+        """Calcule le code du prochain essai, au moins trois secrets restant possibles"""
+
+    def next_code(self) -> Code:
+        """Retourne le code du prochain essai"""
+        if not len(self.candidates):
+            raise ValueError("No secret is consistent with the feedback history")
+        if len(self.candidates) <= 2:
+            return int(self.candidates[0])
+        if not self.deterministic:
+            return self._choose_code()
+        key = (type(self), self.codebook.colors, self.codebook.size, tuple(self.history))
+        with Strategy._decisions_lock:
+            if (code := Strategy._decisions.get(key)) is not None:
+                Strategy._decisions.move_to_end(key)
+                return code
+        if (code := self._book_code()) is None:
+            code = self._choose_code()
+        with Strategy._decisions_lock:
+            Strategy._decisions[key] = code
+            if len(Strategy._decisions) > MAX_DECISIONS:
+                Strategy._decisions.popitem(last=False)
+        return code
+
+    def next_guess(self) -> tuple[Color, ...]:
+        """Retourne le prochain essai sous forme de combinaison de Color"""
+        return self.codebook.decode(self.next_code())
+
+    def partition_sizes(self, guesses: np.ndarray | slice) -> np.ndarray:
+        """Retourne la taille des classes d'indices parmi les secrets encore possibles"""
+        return partition_sizes(self.table, guesses, self.candidates, self.classes_number)
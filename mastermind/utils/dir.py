@@ -1,18 +1,115 @@
-from dataclasses import dataclass
+import os
+from collections import OrderedDict
 from pathlib import Path
+from threading import Lock
 
 ROOT_DIR = Path(__file__).parent.parent.parent
+RESOURCE_DIR = ROOT_DIR / "resource"
+# Taille maximale, en octets, des ressources gardées en mémoire
+MAX_CACHE_BYTES = 2_000_000
 
 
-@dataclass
 class Dir:
     ROOT = ROOT_DIR
-    HTML = ROOT_DIR / "resource" / "html"
-    ICON = ROOT_DIR / "resource" / "icons"
-    STYLE = ROOT_DIR / "resource" / "styles"
+    CACHE = ROOT_DIR / "cache"
+    RESOURCE = RESOURCE_DIR
+    BUNDLE = ROOT_DIR / "resource.zip"
+    HTML = RESOURCE_DIR / "html"
+    ICON = RESOURCE_DIR / "icons"
+    STYLE = RESOURCE_DIR / "styles"
+
+
+class ResourceCache:
+    """Cache des ressources lues, invalidé par la date de modification des fichiers
+    et borné en taille (les moins récemment utilisées sont retirées en premier).
+    Si l'archive Dir.BUNDLE existe, elle est lue en une fois et prime sur les fichiers du dossier resource"""
+    def __init__(self, max_bytes: int = MAX_CACHE_BYTES, bundle: Path = Dir.BUNDLE) -> None:
+        self.max_bytes = max_bytes
+        self.bundle = bundle
+        self._entries: OrderedDict[Path, tuple[int, bytes]] = OrderedDict()
+        self._size = 0
+        self._bundle_mtime: int | None = None
+        self._bundle_entries: dict[str, bytes] = {}
+        self._lock = Lock()
+
+    def _load_bundle(self) -> dict[str, bytes]:
+        """Retourne le contenu de l'archive, relue seulement si elle a été modifiée"""
+        try:
+            mtime = os.stat(self.bundle).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime != self._bundle_mtime:
+            self._bundle_entries = {}
+            if mtime is not None:
+                from zipfile import ZipFile
+                with ZipFile(self.bundle) as archive:
+                    self._bundle_entries = {name: archive.read(name) for name in archive.namelist()}
+            self._bundle_mtime = mtime
+        return self._bundle_entries
+
+    def _store(self, path: Path, mtime: int, data: bytes) -> None:
+        if (previous := self._entries.pop(path, None)) is not None:
+            self._size -= len(previous[1])
+        if len(data) > self.max_bytes:
+            return
+        self._entries[path] = mtime, data
+        self._size += len(data)
+        while self._size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def get(self, filename: Path) -> bytes:
+        """Retourne le contenu de la ressource située au chemin donné"""
+        path = Path(filename)
+        with self._lock:
+            bundle = self._load_bundle()
+            if bundle and path.is_relative_to(RESOURCE_DIR):
+                data = bundle.get(path.relative_to(RESOURCE_DIR).as_posix())
+                if data is not None:
+                    return data
+            mtime = os.stat(path).st_mtime_ns
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == mtime:
+                self._entries.move_to_end(path)
+                return entry[1]
+            with open(path, 'rb') as f:
+                data = f.read()
+            self._store(path, mtime, data)
+            return data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._bundle_mtime = None
+            self._bundle_entries = {}
+
+
+_resources = ResourceCache()
+
+
+def get_resource_bytes(filename: Path) -> bytes:
+    """Retourne le contenu binaire de la ressource située au chemin donné"""
+    return _resources.get(filename)
 
 
 def get_resource(filename: Path) -> str:
     """Retourne le contenu de la ressource située au chemin donné"""
-    with open(filename, 'r', encoding='utf-8') as f:
-        return f.read()
+    return _resources.get(filename).decode('utf-8')
+
+
+def build_bundle(bundle: Path = Dir.BUNDLE) -> Path:
+    """Regroupe toutes les ressources dans une archive non compressée.
+    L'archive doit être reconstruite après toute modification des ressources"""
+    from zipfile import ZipFile
+    temporary = bundle.with_suffix(".tmp")
+    with ZipFile(temporary, 'w') as archive:
+        for path in sorted(RESOURCE_DIR.rglob("*")):
+            if path.is_file():
+                archive.write(path, path.relative_to(RESOURCE_DIR).as_posix())
+    os.replace(temporary, bundle)
+    return bundle
+
+
+if __name__ == '__main__':
+    print(f"Bundle written: {build_bundle()}")
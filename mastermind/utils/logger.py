@@ -1,15 +1,128 @@
+import atexit
 import logging
+import os
+from logging.handlers import QueueHandler, RotatingFileHandler
+from queue import Empty, SimpleQueue
+from threading import Event, Thread
 
 from .dir import Dir
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+MAX_BYTES = 1_000_000
+BACKUP_COUNT = 3
+# Délai, en secondes, pendant lequel les enregistrements s'accumulent avant d'être écrits
+FLUSH_INTERVAL = 0.05
+# Nom du logger des parties (voir model.game.Mastermind)
+GAME_LOGGER = "game"
+
+
+class BatchFileHandler(RotatingFileHandler):
+    """Fichier journal tournant dont le flush est différé jusqu'à la fin d'un lot"""
+    def flush(self) -> None:
+        pass
+
+    def flush_batch(self) -> None:
+        """Force l'écriture sur disque des enregistrements du lot"""
+        super().flush()
+
+    def close(self) -> None:
+        self.flush_batch()
+        super().close()
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Met les enregistrements en file sans les formater : le message n'est construit
+    que par le thread d'écriture. Les arguments des messages doivent être immuables"""
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        return record
+
+
+class LogWriter(Thread):
+    """Unique thread d'écriture du journal : vide la file par lots"""
+    def __init__(self, records: SimpleQueue) -> None:
+        super().__init__(name="log-writer", daemon=True)
+        self.records = records
+        self.stopping = Event()
+        self.handler = BatchFileHandler(Dir.ROOT / "app.log", maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT,
+                                        encoding='utf-8', delay=True)
+        self.handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    def run(self) -> None:
+        running = True
+        while running:
+            record = self.records.get()
+            # Laisse le lot se constituer plutôt que de réveiller le thread à chaque enregistrement
+            if record is not None:
+                self.stopping.wait(FLUSH_INTERVAL)
+            while record is not None:
+                self.handler.handle(record)
+                try:
+                    record = self.records.get_nowait()
+                except Empty:
+                    break
+            running = record is not None
+            self.handler.flush_batch()
+        self.handler.close()
+
+    def stop(self) -> None:
+        """Écrit les enregistrements en attente puis arrête le thread"""
+        self.stopping.set()
+        self.records.put(None)
+        self.join()
+
+
+_queue_handler: DeferredQueueHandler | None = None
+_writer: LogWriter | None = None
+
+
+def _start_writer() -> None:
+    """Démarre le thread d'écriture sur une nouvelle file"""
+    global _writer
+    records = SimpleQueue()
+    _queue_handler.queue = records
+    _writer = LogWriter(records)
+    _writer.start()
+
+
+def _restart_in_child() -> None:
+    """Après un fork, le thread d'écriture n'existe plus dans le processus fils :
+    il est recréé sur une file vide pour ne pas réécrire les enregistrements du parent.
+    Les processus de multiprocessing ne passant pas par atexit, la file est vidée
+    par un finaliseur à leur sortie"""
+    from multiprocessing.util import Finalize
+    _start_writer()
+    Finalize(None, shutdown_logging, exitpriority=0)
+
+
+def shutdown_logging() -> None:
+    """Vide la file et arrête le thread d'écriture"""
+    global _writer
+    if _writer is not None:
+        _writer.stop()
+        _writer = None
+
 
 def setup_logger(name: str, level=logging.DEBUG):
-    """Génère un logger personnalisé"""
+    """Retourne un logger personnalisé. Tous les loggers partagent une même file,
+    écrite dans app.log par un thread en arrière-plan"""
+    global _queue_handler
+    if _queue_handler is None:
+        _queue_handler = DeferredQueueHandler(SimpleQueue())
+        _start_writer()
+        atexit.register(shutdown_logging)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=_restart_in_child)
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    handler = logging.FileHandler(Dir.ROOT / "app.log", encoding='utf-8')
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    if _queue_handler not in logger.handlers:
+        logger.addHandler(_queue_handler)
 
     return logger
+
+
+def quiet_game_log() -> None:
+    """Modes sans interface : les parties se comptant par milliers, voire par millions,
+    seuls les avertissements des parties sont journalisés"""
+    logging.getLogger(GAME_LOGGER).setLevel(logging.WARNING)
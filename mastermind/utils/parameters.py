@@ -19,17 +19,26 @@ class Color(StrEnum):
     @classmethod
     def from_index(cls, index: int) -> Self:
         """Retourne l'instance correspondant à l'index donné"""
-        return list(cls)[index]
+        return _COLORS[index]
 
     def get_opposite(self) -> str:
         """Retourne la couleur opposée au format hexadécimal"""
         return f"#{''.join([f'{hex(255 - c)[2:]:02}' for c in self.to_rgb()])}"
 
+    def to_index(self) -> int:
+        """Retourne l'index de la couleur dans l'énumération"""
+        return COLOR_INDEX[self]
+
     def to_rgb(self) -> tuple[int, ...]:
         """Retourne la couleur au format RGB"""
         return tuple(int(self.value[i:i + 2], 16) for i in range(1, len(self.value), 2))
 
 
+_COLORS = tuple(Color)
+# Index de chaque couleur, qu'elle soit donnée par son membre Color ou par son code hexadécimal
+COLOR_INDEX = {color: i for i, color in enumerate(_COLORS)}
+
+
 class Language(StrEnum):
     FR = 'FR'
     EN = 'EN'
@@ -72,11 +81,29 @@ class Neighbor(Enum):
     LEFT = auto()
 
 
+class Solver(StrEnum):
+    """Classe StrEnum représentant une stratégie de résolution automatique"""
+    RANDOM = 'random'
+    KNUTH = 'knuth'
+    ENTROPY = 'entropy'
+
+    @classmethod
+    def from_string(cls, name: str) -> Self:
+        """Retourne l'instance correspondant au nom donné"""
+        return next(attribute for attribute in cls if attribute.value == name)
+
+    @classmethod
+    def to_list(cls) -> list[str]:
+        """Retourne la liste de tous les attributs au format str"""
+        return list(attribute.value for attribute in cls)
+
+
 class Try(Enum):
     """Classe Enum représentant le nombre maximum d'essais
     pour trouver la combinaison secrète"""
     EASY = 12
     NORMAL = 10
+    PRACTICE = 100
 
     def __str__(self):
         return self.name.lower()
@@ -84,7 +111,7 @@ class Try(Enum):
     @classmethod
     def from_string(cls, name: str) -> Self:
         """Retourne l'instance correspondant au nom donné"""
-        return next(attribute for attribute in cls if attribute.name.lower() == name)
+        return next(attribute for attribute in cls if attribute.name.lower() == name.lower())
 
     @classmethod
     def to_list(cls) -> list[str]:
@@ -95,7 +122,10 @@ class Try(Enum):
 class View(StrEnum):
     """Classe StrEnum représentant une vue"""
     CONSOLE = 'console'
+    ENGINE = 'engine'
     WINDOW = 'window'
+    SIMULATE = 'simulate'
+    SERVE = 'serve'
 
     @classmethod
     def from_string(cls, name: str) -> Self:
@@ -0,0 +1,36 @@
+import sys
+from typing import BinaryIO, Iterable, Iterator
+
+# Taille des tampons de lecture et d'écriture, en octets
+BUFFER_SIZE = 1 << 20
+
+
+class Batch:
+    """Entrées/sorties du mode batch : parties lues ligne à ligne depuis un fichier
+    ou l'entrée standard ('-'), résultats écrits en JSONL sur la sortie standard"""
+    def __init__(self, source: str) -> None:
+        self.source = source
+
+    def _open(self) -> BinaryIO:
+        if self.source == "-":
+            return open(sys.stdin.fileno(), 'rb', buffering=BUFFER_SIZE, closefd=False)
+        return open(self.source, 'rb', buffering=BUFFER_SIZE)
+
+    def read_lines(self) -> Iterator[bytes]:
+        """Parcourt les lignes de la source sans jamais la charger entièrement"""
+        with self._open() as file:
+            yield from file
+
+    @staticmethod
+    def write_lines(lines: Iterable[str]) -> None:
+        """Écrit les lignes de résultat au fil de l'eau, par blocs de BUFFER_SIZE"""
+        with open(sys.stdout.fileno(), 'w', encoding='utf-8', buffering=BUFFER_SIZE, closefd=False) as output:
+            for line in lines:
+                output.write(line)
+                output.write("\n")
+
+    @staticmethod
+    def show_summary(games: int, guesses: int, errors: int, elapsed: float) -> None:
+        """Affiche sur la sortie d'erreur le bilan du traitement, la sortie standard restant du JSONL"""
+        print(f"{games} games, {guesses} guesses, {errors} errors in {elapsed:.2f}s "
+              f"({guesses / elapsed if elapsed else 0:.0f} guesses/s)", file=sys.stderr)
@@ -13,6 +13,11 @@ class Console:
         """Affiche la phrase de fin de partie et la combinaison secrète"""
         print(f"{sentence} {" ".join(combination)}")
 
+    @staticmethod
+    def show_remaining(sentence: str) -> None:
+        """Affiche le nombre de combinaisons encore possibles"""
+        print(sentence)
+
     @staticmethod
     def show_result(combination: tuple[str, ...], clues: tuple[str, ...], indicator: str) -> None:
         """Affiche la combinaison formatée de l'utilisateur suivi des indicateurs associés"""
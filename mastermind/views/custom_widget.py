@@ -1,15 +1,29 @@
 from enum import Enum, auto
+from functools import lru_cache
+from pathlib import Path
 
 from PySide6.QtCore import QSize
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QFont, QIcon, QPixmap
 from PySide6.QtWidgets import QSpacerItem, QSizePolicy, QPushButton
 
-from mastermind.utils.dir import Dir, get_resource
+from mastermind.utils.dir import Dir, get_resource, get_resource_bytes
 
 font_bold = QFont()
 font_bold.setBold(True)
 
 
+@lru_cache(maxsize=8)
+def _icon_from_data(data: bytes) -> QIcon:
+    pixmap = QPixmap()
+    pixmap.loadFromData(data)
+    return QIcon(pixmap)
+
+
+def get_icon(filename: Path) -> QIcon:
+    """Retourne l'icône du fichier donné, décodée une seule fois tant que le fichier ne change pas"""
+    return _icon_from_data(get_resource_bytes(filename))
+
+
 class Orientation(Enum):
     """Défini des constantes pour l'orientation"""
     VERTICAL = auto()
@@ -0,0 +1,30 @@
+import os
+from typing import Iterator
+
+# Taille maximale d'un bloc lu sur l'entrée standard
+READ_SIZE = 1 << 16
+
+
+class Engine:
+    """Entrées/sorties du mode engine, sans tampon Python : l'entrée standard est lue
+    par blocs bruts et les réponses aux lignes d'un bloc sont écrites en une seule fois"""
+    def __init__(self, input_fd: int = 0, output_fd: int = 1) -> None:
+        self.input_fd = input_fd
+        self.output_fd = output_fd
+
+    def read_batches(self) -> Iterator[list[bytes]]:
+        """Retourne, pour chaque bloc lu, ses lignes complètes. La dernière ligne
+        incomplète est gardée pour le bloc suivant, ou retournée seule à la fin de l'entrée"""
+        pending = b""
+        while chunk := os.read(self.input_fd, READ_SIZE):
+            *lines, pending = (pending + chunk).split(b"\n")
+            if lines:
+                yield lines
+        if pending:
+            yield [pending]
+
+    def write(self, lines: list[str]) -> None:
+        """Écrit les lignes de réponse en un seul appel système (plusieurs si la sortie est saturée)"""
+        data = memoryview(("\n".join(lines) + "\n").encode('ascii'))
+        while data:
+            data = data[os.write(self.output_fd, data):]
@@ -1,8 +1,7 @@
-from PySide6.QtGui import QIcon, QPixmap
 from PySide6.QtWidgets import QWidget, QTextBrowser, QVBoxLayout, QScrollArea
 
 from mastermind.utils.dir import Dir, get_resource
-from mastermind.views.custom_widget import CustomButton
+from mastermind.views.custom_widget import CustomButton, get_icon
 
 
 class HelpWindow(QWidget):
@@ -13,7 +12,7 @@ class HelpWindow(QWidget):
         self.translation = translation
         self._setup_ui()
         self.resize(600, 500)
-        self.setWindowIcon((QIcon(QPixmap(Dir.ICON / "logo.png"))))
+        self.setWindowIcon(get_icon(Dir.ICON / "logo.png"))
         self.setStyleSheet(get_resource(Dir.STYLE / "help.qss"))
 
     def _setup_ui(self) -> None:
@@ -1,13 +1,19 @@
 from PySide6.QtCore import Qt, Signal, QEvent, QSize
-from PySide6.QtGui import QIcon, QPixmap, QKeyEvent
-from PySide6.QtWidgets import QWidget, QLabel, QGridLayout, QVBoxLayout, QHBoxLayout, QComboBox
+from PySide6.QtGui import QKeyEvent, QWheelEvent
+from PySide6.QtWidgets import QWidget, QLabel, QGridLayout, QVBoxLayout, QHBoxLayout, QComboBox, QScrollBar
 
+from mastermind.model.board import Board
+from mastermind.model.settings import DOT
 from mastermind.utils.dir import Dir, get_resource
 from mastermind.utils.parameters import Color, Neighbor, Language
 from mastermind.views.confirmation import ConfirmationMessage
-from mastermind.views.piece import PieceColor, PieceTry
+from mastermind.views.piece import PieceColor
 from mastermind.views.row import RowTry, Status, RowSecret
-from mastermind.views.custom_widget import Orientation, CustomSpacer, CustomButton
+from mastermind.views.custom_widget import Orientation, CustomSpacer, CustomButton, get_icon
+
+# Nombre maximum de lignes d'essai créées : au-delà, le plateau défile
+# et ces lignes affichent la partie de l'historique visible
+VISIBLE_ROWS = 12
 
 
 class MainWindow(QWidget):
@@ -17,15 +23,18 @@ class MainWindow(QWidget):
     restart = Signal()
     show_rules = Signal()
     change_language = Signal(str)
+    request_hint = Signal()
+    closed = Signal()
 
     def __init__(self) -> None:
         super().__init__()
 
-        self.rows: dict[int, RowTry] = {}
+        self.rows: list[RowTry] = []
+        self.first_row = 0
         self.pieces_colors = []
         self.game_in_progress = False
         PieceColor.number = 0
-        self.setWindowIcon((QIcon(QPixmap(Dir.ICON / "logo.png"))))
+        self.setWindowIcon(get_icon(Dir.ICON / "logo.png"))
         self.setStyleSheet(get_resource(Dir.STYLE / "main.qss"))
         self.setMinimumWidth(450)
 
@@ -45,9 +54,10 @@ class MainWindow(QWidget):
     def _setup_ui_create_widgets(self, max_tries: int,
                        level: int,
                        secret_combination: tuple[Color, ...]) -> None:
-        for i in range(max_tries):
-            row = RowTry(self, i + 1)
-            self.rows[i] = row
+        self.board = Board(max_tries)
+        for i in range(min(max_tries, VISIBLE_ROWS)):
+            self.rows.append(RowTry(self, i + 1))
+        self.sb_rows = QScrollBar(Qt.Orientation.Vertical, self)
 
         self.row_secret = RowSecret(secret_combination)
 
@@ -62,6 +72,9 @@ class MainWindow(QWidget):
 
         self.vertical_spacer_2 = CustomSpacer(Orientation.VERTICAL)
         self.btn_try = CustomButton()
+        self.lab_remaining = QLabel()
+        self.btn_hint = CustomButton()
+        self.lab_hint = QLabel()
         self.vertical_spacer_3 = CustomSpacer(Orientation.VERTICAL)
 
         self.btn_help = CustomButton()
@@ -69,8 +82,8 @@ class MainWindow(QWidget):
         self.btn_quit = CustomButton()
 
     def _setup_ui_modify_widgets(self, language: Language) -> None:
-        self.rows[0].set_status(Status.ACTIVATED)
-        self.num_row_enabled = 0
+        self._refresh_row(0)
+        self._set_scroll_range()
 
         for lang in Language:
             self.cb_language.addItem(lang.name, lang)
@@ -83,8 +96,18 @@ class MainWindow(QWidget):
         self.btn_try.setEnabled(False)
         self.btn_try.setObjectName("btn_try")
 
+        self.lab_remaining.setStyleSheet("color: white;")
+        self.lab_remaining.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.lab_remaining.setWordWrap(True)
+
+        self.lab_hint.setStyleSheet("color: white;")
+        self.lab_hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.lab_hint.setWordWrap(True)
+        self.lab_hint.setTextFormat(Qt.TextFormat.RichText)
+
     def _setup_ui_create_layouts(self) -> None:
         self.main_layout = QGridLayout(self)
+        self.board_layout = QHBoxLayout()
         self.tries_layout = QVBoxLayout()
         self.translate_layout = QHBoxLayout()
         self.color_layout = QVBoxLayout()
@@ -94,8 +117,10 @@ class MainWindow(QWidget):
         self.buttons_layout.setContentsMargins(0, 20, 0, 0)
 
     def _setup_ui_add_widgets_to_layouts(self) -> None:
-        for row in self.rows.values():
+        for row in self.rows:
             self.tries_layout.addLayout(row)
+        self.board_layout.addLayout(self.tries_layout)
+        self.board_layout.addWidget(self.sb_rows)
 
         self.translate_layout.addSpacerItem(self.horizontal_spacer)
         self.translate_layout.addWidget(self.cb_language)
@@ -109,34 +134,101 @@ class MainWindow(QWidget):
 
         self.color_layout.addSpacerItem(self.vertical_spacer_2)
         self.color_layout.addWidget(self.btn_try)
+        self.color_layout.addWidget(self.lab_remaining)
+        self.color_layout.addWidget(self.btn_hint)
+        self.color_layout.addWidget(self.lab_hint)
         self.color_layout.addSpacerItem(self.vertical_spacer_3)
 
         self.buttons_layout.addWidget(self.btn_help)
         self.buttons_layout.addWidget(self.btn_new_game)
         self.buttons_layout.addWidget(self.btn_quit)
 
-        self.main_layout.addLayout(self.tries_layout, 0, 0, 1, 1)
+        self.main_layout.addLayout(self.board_layout, 0, 0, 1, 1)
         self.main_layout.addLayout(self.color_layout, 0, 1, 1, 1)
         self.main_layout.addLayout(self.row_secret, 1, 0, 1, 2)
         self.main_layout.addLayout(self.buttons_layout, 2, 0, 1, 2)
 
     def _setup_ui_connections(self) -> None:
+        self.board.peg_listeners.append(self._refresh_piece)
+        self.board.row_listeners.append(self._refresh_row)
+        self.sb_rows.valueChanged.connect(self._scroll_to)
+
         self.cb_language.currentIndexChanged.connect(self._emit_change_language)
 
         for piece_color in self.pieces_colors:
             piece_color.clicked.connect(self.positioned_color)
 
         self.btn_try.clicked.connect(self.validate_combinaison)
+        self.btn_hint.clicked.connect(self.request_hint.emit)
 
         self.btn_help.clicked.connect(self.show_rules.emit)
         self.btn_new_game.clicked.connect(self.restart.emit)
         self.btn_quit.clicked.connect(self.close)
 
+    def reset(self, max_tries: int, level: int, secret_combination: tuple[Color, ...]) -> None:
+        """Remet le plateau à zéro pour une nouvelle partie en réutilisant les composants.
+        Seuls les lignes d'essai et pions de couleur manquants ou en trop sont créés ou supprimés"""
+        resized = len(self.rows) != min(max_tries, VISIBLE_ROWS)
+        self._resize_rows(max_tries)
+        self._resize_pieces_colors(level)
+        self.board.reset(max_tries)
+        self._set_scroll_range()
+        self.sb_rows.setValue(0)
+        self.row_secret.set_secret(secret_combination)
+        self.btn_try.setEnabled(False)
+        self.game_in_progress = False
+        if resized:
+            self.adjustSize()
+        self.setFocus()
+
+    def _resize_rows(self, max_tries: int) -> None:
+        count = min(max_tries, VISIBLE_ROWS)
+        for i in range(len(self.rows), count):
+            self.rows.append(RowTry(self, self.first_row + i + 1))
+            self.tries_layout.addLayout(self.rows[i])
+        for row in self.rows[count:]:
+            self.tries_layout.removeItem(row)
+            row.delete()
+        del self.rows[count:]
+
+    def _set_scroll_range(self) -> None:
+        self.sb_rows.setRange(0, self.board.max_tries - len(self.rows))
+        self.sb_rows.setPageStep(len(self.rows))
+        self.sb_rows.setVisible(self.board.max_tries > len(self.rows))
+
+    def _scroll_to(self, first_row: int) -> None:
+        """Affiche les lignes du plateau à partir de la ligne donnée"""
+        self.first_row = first_row
+        for slot, row in enumerate(self.rows):
+            row.set_number(first_row + slot + 1)
+            self._refresh_row(first_row + slot)
+
+    def _ensure_visible(self, row: int) -> None:
+        """Fait défiler le plateau pour que la ligne donnée soit affichée"""
+        if row < self.first_row:
+            self.sb_rows.setValue(row)
+        elif row >= self.first_row + len(self.rows):
+            self.sb_rows.setValue(row - len(self.rows) + 1)
+
+    def _resize_pieces_colors(self, level: int) -> None:
+        PieceColor.number = len(self.pieces_colors)
+        for i, color in enumerate(list(Color)[len(self.pieces_colors):level], start=len(self.pieces_colors)):
+            piece_color = PieceColor(color)
+            piece_color.clicked.connect(self.positioned_color)
+            self.select_colors_layout.addWidget(piece_color, i // 2, i % 2, 1, 1)
+            self.pieces_colors.append(piece_color)
+        for piece_color in self.pieces_colors[level:]:
+            self.select_colors_layout.removeWidget(piece_color)
+            piece_color.hide()
+            piece_color.deleteLater()
+        del self.pieces_colors[level:]
+
     def setup_ui_translation(self, translation: dict) -> None:
         self.translation = translation
         self.setWindowTitle(translation['main_title'])
         self.lab_select_color.setText(translation['select_color'])
         self.btn_try.setText(translation['submit_button'])
+        self.btn_hint.setText(translation['hint_button'])
         self.btn_quit.setText(translation['quit_button'])
         self.btn_help.setText(translation['help_button'])
         self.btn_new_game.setText(translation['new_game'])
@@ -145,25 +237,33 @@ class MainWindow(QWidget):
         self.change_language.emit(self.cb_language.currentData())
         self.setFocus()
 
-    def _is_active_row_valid(self) -> bool:
-        """Retourne True si une couleur a été appliquée à chaque pion."""
-        return Color.GRAY not in self._get_try_combination()
+    def _row_status(self, row: int) -> Status:
+        if row > self.board.active_row:
+            return Status.ON_HOLD
+        if row == self.board.active_row and self.board.playing:
+            return Status.ACTIVATED
+        return Status.DEACTIVATED
+
+    def _refresh_piece(self, row: int, index: int) -> None:
+        if 0 <= row - self.first_row < len(self.rows):
+            self.rows[row - self.first_row].refresh_piece(self.board, row, index)
 
-    def _get_try_combination(self) -> list[Color]:
-        """Récupère la liste des couleurs de la ligne active."""
-        try_layout = self.rows[self.num_row_enabled].colors_layout
-        return [try_layout.itemAt(i).widget().color for i in range(try_layout.count())]
+    def _refresh_row(self, row: int) -> None:
+        if 0 <= row - self.first_row < len(self.rows):
+            self.rows[row - self.first_row].refresh(self.board, row, self._row_status(row))
 
     def activate_next_try(self) -> None:
         """Activation de la prochaine ligne d'essai"""
-        self.num_row_enabled += 1
-        self.rows[self.num_row_enabled].set_status(Status.ACTIVATED)
+        self.board.activate_next_row()
+        self._ensure_visible(self.board.active_row)
 
     def closeEvent(self, event: QEvent) -> None:
         """Gère les événements de fermeture.
         Demande confirmation si une partie est en cours"""
         if self.game_in_progress:
             event.accept() if self.confirmation_interruption() else event.ignore()
+        if event.isAccepted():
+            self.closed.emit()
 
     def confirmation_interruption(self) -> bool:
         """Retourne le choix de l'utilisateur via une boite de dialogue
@@ -176,45 +276,56 @@ class MainWindow(QWidget):
 
     def deactivate_row(self) -> None:
         """Désactivation de la ligne active"""
-        self.rows[self.num_row_enabled].set_status(Status.DEACTIVATED)
+        self.board.deactivate_row()
         self.btn_try.setEnabled(False)
 
     def display_clues(self, clues: tuple[Color]) -> None:
         """Affiche dans la ligne active les couleurs des indices
         passés en paramètres."""
-        clue_layout = self.rows[self.num_row_enabled].clues_layout
-        for i, color in enumerate(clues):
-            clue_layout.itemAt(i).widget().set_color(color)
+        self.board.set_clues(clues)
 
-    def display_game_over(self, is_win: bool) -> None:
-        """Affichage de fin partie, la combinaison
-        secrète est révélée."""
+    def display_remaining(self, text: str) -> None:
+        """Affiche le nombre de combinaisons encore possibles"""
+        self.lab_remaining.setText(text)
+
+    def display_hint(self, text: str, combination: tuple[Color, ...] = ()) -> None:
+        """Affiche un indice : un texte suivi, le cas échéant, des couleurs de l'essai conseillé"""
+        dots = "".join(f'<span style="color: {color.value}; font-size: 18px;">{DOT}</span>' for color in combination)
+        self.lab_hint.setText(f"{text} {dots}" if dots else text)
+
+    def display_game_over(self, is_win: bool, secret_combination: tuple[Color, ...]) -> None:
+        """Affichage de fin partie, la combinaison secrète est révélée.
+        Elle est transmise à nouveau car le mode adversaire ne la fixe qu'en fin de partie"""
+        self.row_secret.set_secret(secret_combination)
         self.row_secret.reveal_combination(is_win, self.translation)
 
+    def wheelEvent(self, event: QWheelEvent) -> None:
+        """La molette fait défiler le plateau lorsqu'il ne tient pas en entier"""
+        if self.sb_rows.isVisible():
+            self.sb_rows.wheelEvent(event)
+
     def keyPressEvent(self, event: QKeyEvent) -> None:
         """Émet le signal event_keyboard avec la ou les touches
         tapées par l'utilisateur"""
         self.event_keyboard.emit(event)
 
-    def piece_selected(self, piece_try: PieceTry) -> None:
-        """Le pion cliqué passe à l'état sélectionné. Les autres
-        sont désélectionnés s'ils l'étaient."""
-        try_layout = self.rows[self.num_row_enabled].children()[0]
-        for i in range(try_layout.count()):
-            try_layout.itemAt(i).widget().set_selected(False)
-        piece_try.set_selected(True)
+    def piece_selected(self, index: int) -> None:
+        """Le pion cliqué de la ligne active passe à l'état sélectionné,
+        le précédent est désélectionné."""
+        self.board.select(index)
+
+    def select_neighbor(self, neighbor: Neighbor) -> None:
+        """Sélectionne le pion qui suit ou précède le pion sélectionné"""
+        self._ensure_visible(self.board.active_row)
+        self.board.select_neighbor(neighbor)
 
     def positioned_color(self, color: Color) -> None:
         """Une couleur est appliquée au pion à l'état sélectionné."""
-        try_layout = self.rows[self.num_row_enabled].colors_layout
-        for i in range(try_layout.count()):
-            if try_layout.itemAt(i).widget().is_selected:
-                try_layout.itemAt(i).widget().set_color(color)
-                break
-        self.rows[self.num_row_enabled].select_neighbor_try_piece(Neighbor.RIGHT)
-        self.btn_try.setEnabled(self._is_active_row_valid())
+        self._ensure_visible(self.board.active_row)
+        self.board.place(color)
+        self.btn_try.setEnabled(self.board.is_complete)
 
     def validate_combinaison(self) -> None:
         """Émet dans un signal la combinaison de la ligne active"""
-        self.evaluation_combination.emit(self._get_try_combination())
+        self.evaluation_combination.emit(list(self.board.combination()))
         self.setFocus()
@@ -1,4 +1,4 @@
-from PySide6.QtWidgets import QLabel, QComboBox, QPushButton, QGridLayout, QDialog, QWidget
+from PySide6.QtWidgets import QLabel, QComboBox, QPushButton, QGridLayout, QDialog, QWidget, QCheckBox
 
 from mastermind.utils.dir import Dir, get_resource
 from mastermind.utils.parameters import Level, Try
@@ -9,11 +9,13 @@ class NewGame(QDialog):
     def __init__(self,
                  parent: QWidget,
                  old_level: Level = Level.NORMAL,
-                 old_tries: Try = Try.NORMAL) -> None:
+                 old_tries: Try = Try.NORMAL,
+                 old_evil: bool = False) -> None:
         super().__init__(parent)
 
         self.level = old_level
         self.tries = old_tries
+        self.evil = old_evil
         self._setup_ui()
         self.setStyleSheet(get_resource(Dir.STYLE / "qdialog.qss"))
 
@@ -31,6 +33,7 @@ class NewGame(QDialog):
         self.lab_description_try = QLabel()
         self.cb_level = QComboBox()
         self.cb_try = QComboBox()
+        self.chk_evil = QCheckBox()
         self.btn_exec = QPushButton()
 
     def _setup_ui_modify_widgets(self) -> None:
@@ -46,6 +49,7 @@ class NewGame(QDialog):
                 tries
             )
         self.cb_try.setCurrentIndex(self.cb_try.findData(self.tries))
+        self.chk_evil.setChecked(self.evil)
         self.btn_exec.setObjectName("btn_green")
 
     def _setup_ui_create_layouts(self) -> None:
@@ -56,7 +60,8 @@ class NewGame(QDialog):
         self.main_layout.addWidget(self.cb_level, 0, 1, 1, 1)
         self.main_layout.addWidget(self.lab_description_try, 1, 0, 1, 1)
         self.main_layout.addWidget(self.cb_try, 1, 1, 1, 1)
-        self.main_layout.addWidget(self.btn_exec, 2, 0, 1, 2)
+        self.main_layout.addWidget(self.chk_evil, 2, 0, 1, 2)
+        self.main_layout.addWidget(self.btn_exec, 3, 0, 1, 2)
 
     def _setup_ui_connections(self) -> None:
         self.btn_exec.clicked.connect(self.accept)
@@ -65,9 +70,10 @@ class NewGame(QDialog):
         self.setWindowTitle(self.parent().translation['new_game'])
         self.lab_description_level.setText(self.parent().translation['nb_colors_availables'])
         self.lab_description_try.setText(self.parent().translation['nb_max_tries'])
+        self.chk_evil.setText(self.parent().translation['evil_mode'])
         self.btn_exec.setText(self.parent().translation['start'])
 
-    def get_params_new_game(self) -> tuple[Level, Try]:
+    def get_params_new_game(self) -> tuple[Level, Try, bool]:
         """Retourne les instances Level et Try sélectionnées
-        dans les QComboBox"""
-        return self.cb_level.currentData(), self.cb_try.currentData()
+        dans les QComboBox et l'activation du mode adversaire"""
+        return self.cb_level.currentData(), self.cb_try.currentData(), self.chk_evil.isChecked()
@@ -1,8 +1,9 @@
 from enum import Enum
+from functools import cache
 
-from PySide6.QtCore import Signal, Qt
-from PySide6.QtGui import QMouseEvent
-from PySide6.QtWidgets import QLabel
+from PySide6.QtCore import Signal, Qt, QRectF
+from PySide6.QtGui import QMouseEvent, QPainter, QPaintEvent, QPixmap, QColor, QPen, QFont
+from PySide6.QtWidgets import QWidget
 
 from mastermind.utils.parameters import Color
 
@@ -15,27 +16,93 @@ class PieceSize(Enum):
     SECRET = 32
 
 
-class Piece(QLabel):
-    """Représentation d'un pion"""
+# Couleurs de la bordure d'un pion sélectionné : haut, droite, bas, gauche
+SELECTION_COLORS = ("green", "red", "blue", "yellow")
+SELECTION_WIDTH = 2
+TEXT_SIZE = 14
+# Couleur du texte d'un pion : l'opposée de sa couleur, calculée une seule fois
+TEXT_COLORS = {color: color.get_opposite() for color in Color}
+
+
+@cache
+def piece_pixmap(color: Color, diameter: int, selected: bool = False,
+                 text: str = "", text_color: str = "", ratio: float = 1.0) -> QPixmap:
+    """Retourne l'image d'un pion, dessinée une seule fois par apparence
+    et partagée par tous les pions qui l'affichent"""
+    pixmap = QPixmap(round(diameter * ratio), round(diameter * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(color.value))
+    painter.drawEllipse(QRectF(0, 0, diameter, diameter))
+    if selected:
+        inset = SELECTION_WIDTH / 2
+        ring = QRectF(inset, inset, diameter - SELECTION_WIDTH, diameter - SELECTION_WIDTH)
+        for quarter, border_color in enumerate(SELECTION_COLORS):
+            painter.setPen(QPen(QColor(border_color), SELECTION_WIDTH))
+            # Les angles sont en 1/16 de degré, dans le sens trigonométrique depuis 3 heures
+            painter.drawArc(ring, (45 - quarter * 90) * 16, 90 * 16)
+    if text:
+        font = QFont()
+        font.setBold(True)
+        font.setPixelSize(TEXT_SIZE)
+        painter.setFont(font)
+        painter.setPen(QColor(text_color))
+        painter.drawText(QRectF(0, 0, diameter, diameter), Qt.AlignmentFlag.AlignCenter, text)
+    painter.end()
+    return pixmap
+
+
+class Piece(QWidget):
+    """Représentation d'un pion, dessiné à partir d'une image partagée
+    plutôt que d'une feuille de style propre à chaque widget"""
     def __init__(self, color: Color = Color.BLACK, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
         self.color = color
+        self.diameter = PieceSize.TRY.value
+        self.is_selected = False
+        self._displayed_color = color
+        self._text = ""
+        self._text_color = ""
+
+    def _set_size(self, size: PieceSize) -> None:
+        self.diameter = size.value
+        self.setFixedSize(size.value, size.value)
+
+    def _display(self, color: Color) -> None:
+        """Change la couleur affichée, le pion n'est redessiné que si elle change"""
+        if color != self._displayed_color:
+            self._displayed_color = color
+            self.update()
+
+    def text(self) -> str:
+        return self._text
+
+    def setText(self, text: str) -> None:
+        if text != self._text:
+            self._text = text
+            self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, piece_pixmap(self._displayed_color, self.diameter, self.is_selected,
+                                              self._text, self._text_color, self.devicePixelRatioF()))
 
 
 class PieceClue(Piece):
     """Représentation d'un indice."""
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self.setMaximumSize(PieceSize.CLUE.value, PieceSize.CLUE.value)
-        self.setMinimumSize(PieceSize.CLUE.value, PieceSize.CLUE.value)
-        self.radius = PieceSize.CLUE.value // 2
+        self._set_size(PieceSize.CLUE)
         self.set_color(Color.BLACK)
 
     def set_color(self, color: Color) -> None:
         """Associe une Color au pion et lui applique"""
         self.color = color
-        self.setStyleSheet(f"border-radius: {self.radius}px;background-color: {color.value};")
+        self._display(color)
 
 
 class PieceColor(Piece):
@@ -45,13 +112,10 @@ class PieceColor(Piece):
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self.setMaximumSize(PieceSize.COLOR.value, PieceSize.COLOR.value)
-        self.setMinimumSize(PieceSize.COLOR.value, PieceSize.COLOR.value)
-        self.radius = PieceSize.COLOR.value // 2
+        self._set_size(PieceSize.COLOR)
         self.set_color(self.color)
         PieceColor.number += 1
         self.setText(f"{PieceColor.number}")
-        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
     def mousePressEvent(self, ev: QMouseEvent) -> None:
         """Emission du signal clicked, portant la couleur du pion cliqué"""
@@ -60,28 +124,22 @@ class PieceColor(Piece):
     def set_color(self, color: Color) -> None:
         """Associe une Color au pion et lui applique"""
         self.color = color
-        self.setStyleSheet(
-            f"""border-radius: {self.radius}px;
-            background-color: {color.value};
-            font-size: 14px;
-            font-weight: bold;
-            color: {color.get_opposite()}""")
+        self._text_color = TEXT_COLORS[color]
+        self._display(color)
 
 
 class PieceSecret(Piece):
     """Label qui compose la combinaison secrète."""
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self.setMaximumSize(PieceSize.SECRET.value, PieceSize.SECRET.value)
-        self.setMinimumSize(PieceSize.SECRET.value, PieceSize.SECRET.value)
-        self.radius = PieceSize.SECRET.value // 2
+        self._set_size(PieceSize.SECRET)
+        self._text_color = Color.BLACK.value
         self.set_color(Color.GRAY)
         self.setText("?")
-        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
     def set_color(self, color: Color) -> None:
         """Applique une couleur au pion"""
-        self.setStyleSheet(f"border-radius: {self.radius}px;background-color: {color.value};")
+        self._display(color)
 
 
 class PieceTry(Piece):
@@ -92,36 +150,21 @@ class PieceTry(Piece):
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self.setMaximumSize(PieceSize.TRY.value, PieceSize.TRY.value)
-        self.setMinimumSize(PieceSize.TRY.value, PieceSize.TRY.value)
-        self.radius = PieceSize.TRY.value // 2
-        self.is_selected = False
-        self.next_piece = self.previous_piece = None
+        self._set_size(PieceSize.TRY)
 
     def mousePressEvent(self, ev: QMouseEvent) -> None:
         """Emission du signal clicked"""
         self.clicked.emit()
 
-    def setEnabled(self, arg__1: bool) -> None:
-        """Défini l'état d'activation (True ou False) du pion"""
-        super().setEnabled(arg__1)
-        if not arg__1:
-            self.set_selected(arg__1)
-
     def set_color(self, color: Color) -> None:
-        """Défini et applique une couleur au pion et ajoute une bordure
-        s'il est à l'état 'sélectionné'."""
+        """Défini et applique une couleur au pion, dessiné avec une
+        bordure s'il est à l'état 'sélectionné'."""
         self.color = color
-        self.setStyleSheet(
-            f"border-radius: {self.radius}px;"
-            f"background-color: {color.value};"
-            f"border-color: {'green red blue yellow' if self.is_selected else ''};"
-            f"border-width: {'2px' if self.is_selected else '0px'};"
-            "border-style: solid;"
-        )
+        self._display(color)
 
     def set_selected(self, selected: bool) -> None:
         """Change l'état 'sélectionné' à True ou False du pion
         et modifie son apparence."""
-        self.is_selected = selected
-        self.set_color(self.color)
+        if selected != self.is_selected:
+            self.is_selected = selected
+            self.update()
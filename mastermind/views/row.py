@@ -4,8 +4,9 @@ from functools import partial
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtWidgets import QGridLayout, QHBoxLayout, QWidget, QSizePolicy, QFrame, QLabel
 
+from mastermind.model.board import Board
 from mastermind.model.settings import SIZE_COMBINATION
-from mastermind.utils.parameters import Color, Neighbor
+from mastermind.utils.parameters import Color
 from mastermind.views.piece import PieceClue, PieceTry, PieceSecret
 from mastermind.views.custom_widget import CustomSpacer, Orientation, font_bold
 
@@ -44,6 +45,21 @@ class Row(QHBoxLayout):
         self.colors_layout = QHBoxLayout()
         self.clues_layout = QGridLayout()
 
+    def delete(self) -> None:
+        """Supprime la ligne et tous ses composants"""
+        Row._delete_items(self)
+        self.deleteLater()
+
+    @staticmethod
+    def _delete_items(layout) -> None:
+        while (item := layout.takeAt(0)) is not None:
+            if item.widget() is not None:
+                item.widget().hide()
+                item.widget().deleteLater()
+            elif item.layout() is not None:
+                Row._delete_items(item.layout())
+                item.layout().deleteLater()
+
 
 class RowSecret(Row):
     """Représente la ligne contenant la combinaison secrète."""
@@ -68,6 +84,15 @@ class RowSecret(Row):
         self.la_game_over.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.addWidget(self.la_game_over)
 
+    def set_secret(self, secret_colours: tuple[Color, ...]) -> None:
+        """Remplace la combinaison secrète par une nouvelle, masquée"""
+        for i, color in enumerate(secret_colours):
+            piece_secret: PieceSecret = self.colors_layout.itemAt(i).widget()
+            piece_secret.color = color
+            piece_secret.set_color(Color.GRAY)
+            piece_secret.setText("?")
+        self.la_game_over.setText('')
+
     def reveal_combination(self, winner: bool, translation: dict) -> None:
         """Modifie l'apparence de la ligne pour révéler la combinaison
         secrète et afficher si la partie est gagnée ou perdue."""
@@ -84,19 +109,17 @@ class RowSecret(Row):
 
 
 class RowTry(Row):
-    """Représente une ligne d'essai."""
+    """Représente une ligne d'essai, affichée à partir de l'état du plateau (Board)."""
     def __init__(self, parent: QWidget, row_number: int) -> None:
         super().__init__()
 
         self.la_title.setText(f"{row_number}")
-        pieces_try = [PieceTry(Color.BLACK) for _ in range(SIZE_COMBINATION)]
-        for i in range(SIZE_COMBINATION):
-            piece_try = pieces_try[i]
-            piece_try.next_piece = pieces_try[i + 1 if i < SIZE_COMBINATION - 1 else 0]
-            piece_try.previous_piece = pieces_try[i - 1 if i > 0 else SIZE_COMBINATION - 1]
-            piece_try.clicked.connect(partial(parent.piece_selected, piece_try))
+        self.pieces = [PieceTry(Color.BLACK) for _ in range(SIZE_COMBINATION)]
+        self.clues = [PieceClue() for _ in range(SIZE_COMBINATION)]
+        for i, (piece_try, piece_clue) in enumerate(zip(self.pieces, self.clues)):
+            piece_try.clicked.connect(partial(parent.piece_selected, i))
+            piece_try.setEnabled(False)
             self.colors_layout.addWidget(piece_try)
-            piece_clue = PieceClue()
             self.clues_layout.addWidget(piece_clue, i % 2, i // 2, 1, 1)
 
         self.addWidget(self.la_title)
@@ -107,40 +130,35 @@ class RowTry(Row):
         self.addWidget(self.separator2)
         self.addLayout(self.clues_layout)
         self.addSpacerItem(CustomSpacer(Orientation.HORIZONTAL))
-        self.set_status(Status.ON_HOLD)
-
-    def select_neighbor_try_piece(self, neighbor: Neighbor) -> None:
-        """Passe à l'état 'sélectionné' le pion qui suit ou précède celui
-        qui est actuellement 'sélectionné' dans la ligne."""
-        direction = (range(self.colors_layout.count())
-                     if neighbor == Neighbor.RIGHT
-                     else range(self.colors_layout.count() - 1, -1, -1))
-        piece_try: PieceTry | None = next(
-            (self.colors_layout.itemAt(i).widget() for i in direction
-             if self.colors_layout.itemAt(i).widget().is_selected),
-            None
-        )
-        if piece_try:
-            piece_try.set_selected(False)
-            (piece_try.next_piece.set_selected(True)
-             if neighbor == Neighbor.RIGHT
-             else piece_try.previous_piece.set_selected(True))
+        self.status = Status.ON_HOLD
+
+    def set_number(self, row_number: int) -> None:
+        self.la_title.setText(f"{row_number}")
+
+    def refresh_piece(self, board: Board, row: int, index: int) -> None:
+        """Met à jour un pion d'après l'état du plateau, il n'est redessiné que s'il a changé"""
+        piece_try = self.pieces[index]
+        piece_try.set_color(board.color(row, index))
+        piece_try.set_selected(board.is_selected(row, index))
+
+    def refresh(self, board: Board, row: int, status: Status) -> None:
+        """Met à jour l'état, les pions et les indices de la ligne d'après l'état du plateau"""
+        self.set_status(status)
+        for index in range(len(self.pieces)):
+            self.refresh_piece(board, row, index)
+        clues = board.clues(row)
+        for i, piece_clue in enumerate(self.clues):
+            piece_clue.set_color(clues[i] if i < len(clues) else Color.BLACK)
 
     def set_status(self, status: Status) -> None:
         """Modifie l'apparence de la ligne en fonction de l'état donné."""
-        for i in range(self.colors_layout.count()):
-            match status:
-                case Status.ON_HOLD:
-                    self.colors_layout.itemAt(i).widget().set_color(Color.BLACK)
-                    self.colors_layout.itemAt(i).widget().setEnabled(False)
-                case Status.ACTIVATED:
-                    self.colors_layout.itemAt(i).widget().set_color(Color.GRAY)
-                    self.la_title.setStyleSheet("color: white;")
-                    self.separator1.set_color(True)
-                    self.separator2.set_color(True)
-                    self.colors_layout.itemAt(i).widget().setEnabled(True)
-                case Status.DEACTIVATED:
-                    self.colors_layout.itemAt(i).widget().setEnabled(False)
-
-        if status == Status.ACTIVATED:
-            self.colors_layout.itemAt(0).widget().set_selected(True)
+        if status == self.status:
+            return
+        if Status.ON_HOLD in (status, self.status):
+            enabled = status != Status.ON_HOLD
+            self.la_title.setStyleSheet("color: white;" if enabled else "color: black")
+            self.separator1.set_color(enabled)
+            self.separator2.set_color(enabled)
+        for piece_try in self.pieces:
+            piece_try.setEnabled(status == Status.ACTIVATED)
+        self.status = status
@@ -0,0 +1,11 @@
+class Server:
+    """Affiche en mode console l'état du serveur de parties"""
+    @staticmethod
+    def show_start(host: str, port: int, max_sessions: int, idle_timeout: float) -> None:
+        """Affiche l'adresse d'écoute et les limites des sessions"""
+        print(f"Serving on {host}:{port} (max {max_sessions} sessions, idle timeout {idle_timeout:.0f}s)", flush=True)
+
+    @staticmethod
+    def show_stop(sessions: int) -> None:
+        """Affiche le nombre de parties encore en mémoire à l'arrêt du serveur"""
+        print(f"Server stopped with {sessions} sessions", flush=True)
@@ -0,0 +1,30 @@
+from mastermind.utils.parameters import Level, Solver, Try
+
+
+class Simulation:
+    """Affiche en mode console les statistiques d'une simulation de parties"""
+    @staticmethod
+    def show_start(games: int, level: Level, tries: Try, solver: Solver, workers: int, seed: int) -> None:
+        """Affiche les paramètres de la simulation, dont la graine qui permet de la rejouer (--seed)"""
+        print(f"Simulation: {games} games, level {level}, tries {tries}, strategy {solver}, "
+              f"{workers} workers, seed {seed}")
+
+    @staticmethod
+    def show_progress(histogram: list[int], elapsed: float) -> None:
+        """Affiche le nombre de parties jouées, le taux de victoire et le débit"""
+        games = sum(histogram)
+        win_rate = (games - histogram[0]) / games if games else 0
+        print(f"{games} games | win rate {win_rate:.2%} | {games / elapsed:.0f} games/s", flush=True)
+
+    @staticmethod
+    def show_summary(histogram: list[int], elapsed: float) -> None:
+        """Affiche les statistiques finales et l'histogramme du nombre d'essais"""
+        Simulation.show_progress(histogram, elapsed)
+        games, wins = sum(histogram), sum(histogram[1:])
+        if wins:
+            average = sum(tries * count for tries, count in enumerate(histogram)) / wins
+            print(f"Average guesses per win: {average:.3f}")
+        for tries, count in enumerate(histogram[1:], 1):
+            if count:
+                print(f"{tries:>3} guesses: {count:>10} ({count / games:.2%})")
+        print(f"  lost     : {histogram[0]:>10} ({histogram[0] / games:.2%})" if games else "No game played")